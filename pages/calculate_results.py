@@ -71,14 +71,9 @@ def show_calculate_results_page():
                 st.rerun()
     
     try:
-        # Create calculator
-        calculator = CostCalculator(st.session_state.lcp_data)
-        
         # Calculate results
         with st.spinner("Calculating costs..."):
-            cost_schedule = calculator.build_cost_schedule()
-            summary_stats = calculator.calculate_summary_statistics()
-            category_costs = calculator.get_cost_by_category()
+            cost_schedule, summary_stats, category_costs = calculate_results(st.session_state.lcp_data)
         
         # Display results in tabs
         tab1, tab2, tab3, tab4 = st.tabs(["📊 Summary", "📈 Charts", "📋 Cost Schedule", "🏷️ By Category"])
@@ -110,6 +105,26 @@ def show_calculate_results_page():
             st.session_state.page = "🏠 Home"
             st.rerun()
 
+def calculate_results(lcp):
+    """Build the cost schedule, summary statistics and category costs for a plan.
+    
+    The results are kept in session state with a hash of the plan's repr, so reruns
+    that leave the plan unchanged skip the calculation.
+    """
+    signature = hash(repr(lcp))
+    cached = st.session_state.get('_calculation_cache')
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    calculator = CostCalculator(lcp)
+    results = (
+        calculator.build_cost_schedule(),
+        calculator.calculate_summary_statistics(),
+        calculator.get_cost_by_category(),
+    )
+    st.session_state._calculation_cache = (signature, results)
+    return results
+
 def show_summary_tab(summary_stats, cost_schedule):
     """Show summary statistics."""
     st.subheader("📊 Executive Summary")
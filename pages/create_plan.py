@@ -3,10 +3,12 @@ Create/Edit Evaluee Page for Streamlit Life Care Plan Application
 """
 
 import streamlit as st
+import time
 from datetime import datetime
 from src.models import LifeCarePlan, Evaluee, ProjectionSettings
 from src.database import db
 from src.auth import auth
+from src.autosave import release_current_plan
 
 def show_create_plan_page():
     """Display the create/edit evaluee page."""
@@ -22,6 +24,7 @@ def show_create_plan_page():
         col1, col2 = st.columns([3, 1])
         with col2:
             if st.button("🆕 Create New Plan Instead", use_container_width=True):
+                release_current_plan(save_pending=True)
                 st.session_state.lcp_data = None
                 st.rerun()
     
@@ -151,7 +154,7 @@ def show_create_plan_page():
                         current_user = auth.get_current_user()
                         user_id = current_user['id'] if current_user else None
                         db.save_life_care_plan(st.session_state.lcp_data, user_id)
-                        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
+                        st.session_state.last_saved = time.time()
                         st.info("💾 Auto-saved to database")
                     except Exception as e:
                         st.warning(f"Auto-save failed: {str(e)}")
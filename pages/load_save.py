@@ -8,6 +8,7 @@ import tempfile
 import os
 from datetime import datetime
 from src.models import LCPConfigModel
+from src.autosave import release_current_plan
 
 def show_load_save_page():
     """Display the load/save configurations page."""
@@ -268,6 +269,7 @@ def load_configuration(config_data):
         lcp = config_model.to_life_care_plan()
         
         # Store in session state
+        release_current_plan(save_pending=True)
         st.session_state.lcp_data = lcp
         
         st.success(f"✅ Configuration loaded successfully for {lcp.evaluee.name}!")
@@ -7,10 +7,12 @@ see their details, and delete them if needed.
 """
 
 import streamlit as st
+import time
 import pandas as pd
 from datetime import datetime
 from src.database import db
 from src.auth import auth
+from src.autosave import release_current_plan
 
 def show_manage_evaluees_page():
     """Display the manage evaluees page."""
@@ -140,8 +142,9 @@ def show_manage_evaluees_page():
                         try:
                             lcp_data = db.load_life_care_plan(evaluee['name'])
                             if lcp_data:
+                                release_current_plan(save_pending=True)
                                 st.session_state.lcp_data = lcp_data
-                                st.session_state.last_saved = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                                st.session_state.last_saved = time.time()
                                 st.success(f"✅ Loaded {evaluee['name']}")
                                 st.rerun()
                             else:
@@ -154,8 +157,9 @@ def show_manage_evaluees_page():
                         try:
                             lcp_data = db.load_life_care_plan(evaluee['name'])
                             if lcp_data:
+                                release_current_plan(save_pending=True)
                                 st.session_state.lcp_data = lcp_data
-                                st.session_state.last_saved = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                                st.session_state.last_saved = time.time()
                                 st.session_state.navigate_to = "👤 Create/Edit Evaluee"
                                 st.rerun()
                             else:
@@ -226,6 +230,7 @@ def show_manage_evaluees_page():
                                     # Clear from session if it's the current evaluee
                                     if (st.session_state.get('lcp_data') and 
                                         st.session_state.lcp_data.evaluee.name == evaluee['name']):
+                                        release_current_plan()
                                         keys_to_clear = ['lcp_data', 'current_table', 'show_calculations', 'last_saved']
                                         for key in keys_to_clear:
                                             if key in st.session_state:
@@ -279,6 +284,7 @@ def show_manage_evaluees_page():
                             db.delete_evaluee(evaluee['name'])
                         
                         # Clear session state safely
+                        release_current_plan()
                         keys_to_clear = ['lcp_data', 'current_table', 'show_calculations', 'last_saved']
                         for key in keys_to_clear:
                             if key in st.session_state:
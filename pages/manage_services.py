@@ -2,118 +2,299 @@
 Manage Service Tables Page for Streamlit Life Care Plan Application
 """
 
+import bisect
+import csv
+import functools
+import io
+import re
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from dataclasses import astuple, dataclass
+from enum import IntEnum
+from typing import List, Optional, Tuple
 from src.models import ServiceTable, Service
-from src.database import db
+from src.autosave import flush_pending_saves, schedule_save
 
 def calculate_age_for_year(base_year: int, current_age: float, target_year: int) -> float:
     """Calculate the age of the evaluee in a given year."""
     return current_age + (target_year - base_year)
 
+@functools.lru_cache(maxsize=256)
+def _ages_caption(years: Tuple[int, ...], evaluee_current_age: float, base_year: int) -> str:
+    """Build the age caption for a non-empty tuple of years, listed in order."""
+    years = sorted(years)
+    if len(years) == 1:
+        age = calculate_age_for_year(base_year, evaluee_current_age, years[0])
+        return f"📅 Age in {years[0]}: **{age:.1f} years old**"
+    ages_info = ", ".join(
+        f"{year} (age {evaluee_current_age + (year - base_year):.1f})"
+        for year in years
+    )
+    return f"📅 Ages: {ages_info}"
+
 def display_age_info(years, evaluee_current_age: float, base_year: int):
-    """Display age information for given years."""
+    """Display age information for given years.
+    
+    The caption is keyed on the years as entered, so reruns that leave them unchanged
+    reuse it without sorting or formatting again. It is still emitted every run, since
+    Streamlit drops elements a rerun does not draw.
+    """
+    if isinstance(years, int):
+        years = (years,)
     if isinstance(years, (list, tuple)) and len(years) > 0:
-        if len(years) == 1:
-            age = calculate_age_for_year(base_year, evaluee_current_age, years[0])
-            st.caption(f"📅 Age in {years[0]}: **{age:.1f} years old**")
+        st.caption(_ages_caption(tuple(years), evaluee_current_age, base_year))
+
+@functools.lru_cache(maxsize=256)
+def _years_display(occurrence_years: Tuple[int, ...]) -> str:
+    """Join a service's occurrence years for display, truncated to 50 characters."""
+    years_display = ', '.join(map(str, occurrence_years))
+    if len(years_display) > 50:
+        years_display = years_display[:47] + "..."
+    return years_display
+
+@functools.lru_cache(maxsize=64)
+def _available_years(base_year: int, projection_years: float) -> Tuple[int, ...]:
+    """Years selectable in the projection period, counting a partial final year."""
+    end_year = base_year + int(projection_years)
+    if projection_years % 1 != 0:
+        end_year += 1
+    return tuple(range(base_year, end_year))
+
+# A comma-separated list of integers, and the integers within it
+_YEAR_LIST_RE = re.compile(r'\s*[+-]?\d+\s*(?:,\s*[+-]?\d+\s*)*')
+_YEAR_RE = re.compile(r'[+-]?\d+')
+
+@functools.lru_cache(maxsize=512)
+def _parse_years(years_str: str) -> Optional[Tuple[int, ...]]:
+    """Parse a comma-separated list of years, or return None if any entry is not an integer."""
+    if not _YEAR_LIST_RE.fullmatch(years_str):
+        return None
+    return tuple(map(int, _YEAR_RE.findall(years_str)))
+
+def _merge_years(years) -> List[Tuple[int, int]]:
+    """Collapse a collection of years into sorted, non-adjacent (lo, hi) intervals."""
+    intervals = []
+    for year in sorted(set(years)):
+        if intervals and year == intervals[-1][1] + 1:
+            intervals[-1] = (intervals[-1][0], year)
+        else:
+            intervals.append((year, year))
+    return intervals
+
+def _interval_occurrence_years(interval_start_year, interval_years, end_year):
+    """Get the rounded occurrence years of an interval-based service up to end_year."""
+    years = set()
+    # For decimal intervals, calculate the fractional year positions and round to nearest year
+    current_fractional_year = float(interval_start_year)
+    while current_fractional_year <= end_year:
+        # Round to nearest integer year
+        occurrence_year = round(current_fractional_year)
+        if occurrence_year <= end_year:
+            years.add(occurrence_year)
+        current_fractional_year += interval_years
+    return years
+
+def expand_years(intervals) -> List[int]:
+    """Expand (lo, hi) intervals into a sorted list of concrete years."""
+    years = []
+    for lo, hi in intervals:
+        years.extend(range(lo, hi + 1))
+    return years
+
+def _overlap_intervals(intervals_a, intervals_b) -> List[Tuple[int, int]]:
+    """Intersect two sorted interval lists with a linear merge walk."""
+    overlaps = []
+    i = j = 0
+    while i < len(intervals_a) and j < len(intervals_b):
+        lo = max(intervals_a[i][0], intervals_b[j][0])
+        hi = min(intervals_a[i][1], intervals_b[j][1])
+        if lo <= hi:
+            overlaps.append((lo, hi))
+        if intervals_a[i][1] < intervals_b[j][1]:
+            i += 1
         else:
-            ages_info = []
-            for year in sorted(years):
-                age = calculate_age_for_year(base_year, evaluee_current_age, year)
-                ages_info.append(f"{year} (age {age:.1f})")
-            st.caption(f"📅 Ages: {', '.join(ages_info)}")
-    elif isinstance(years, int):
-        age = calculate_age_for_year(base_year, evaluee_current_age, years)
-        st.caption(f"📅 Age in {years}: **{age:.1f} years old**")
+            j += 1
+    return overlaps
+
+def _any_overlap(intervals_a, intervals_b) -> bool:
+    """Check whether two sorted interval lists share any year, stopping at the first hit."""
+    i = j = 0
+    while i < len(intervals_a) and j < len(intervals_b):
+        if intervals_a[i][0] <= intervals_b[j][1] and intervals_b[j][0] <= intervals_a[i][1]:
+            return True
+        if intervals_a[i][1] < intervals_b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return False
+
+@dataclass(frozen=True)
+class TimingView:
+    """Hashable view of the timing fields of a Service or of new-service form data.
+    
+    Built from values rather than id(service) because services are edited in place,
+    so equal views can share cached intervals.
+    """
+    is_one_time_cost: bool = False
+    one_time_cost_year: Optional[int] = None
+    occurrence_years: Optional[Tuple[int, ...]] = None
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+    is_distributed_instances: bool = False
+    distribution_period_years: Optional[float] = None
+    is_interval_based: bool = False
+    interval_years: Optional[float] = None
+    interval_start_year: Optional[int] = None
+    projection_end_year: Optional[int] = None
+    
+    @classmethod
+    def from_service(cls, service) -> 'TimingView':
+        """Build a view from a Service object or a dict with the same field names."""
+        get = service.get if isinstance(service, dict) else functools.partial(getattr, service)
+        
+        is_interval_based = bool(get('is_interval_based', False))
+        projection_end_year = None
+        if is_interval_based:
+            # Interval occurrences are clipped to the projection period held in session state
+            lcp = st.session_state.get('lcp_data')
+            if lcp:
+                settings = lcp.settings
+                projection_end_year = settings.base_year + int(settings.projection_years)
+        
+        occurrence_years = get('occurrence_years', None)
+        return cls(
+            is_one_time_cost=bool(get('is_one_time_cost', False)),
+            one_time_cost_year=get('one_time_cost_year', None),
+            occurrence_years=tuple(occurrence_years) if occurrence_years else None,
+            start_year=get('start_year', None),
+            end_year=get('end_year', None),
+            is_distributed_instances=bool(get('is_distributed_instances', False)),
+            distribution_period_years=get('distribution_period_years', None),
+            is_interval_based=is_interval_based,
+            interval_years=get('interval_years', None),
+            interval_start_year=get('interval_start_year', None),
+            projection_end_year=projection_end_year,
+        )
+    
+    def intervals(self) -> Tuple[Tuple[int, int], ...]:
+        """Get the years covered by this timing as sorted (lo, hi) intervals."""
+        return _intervals_for_timing(self)
+    
+    @functools.cached_property
+    def service_type(self) -> str:
+        """Classify the timing as shown in the unified views."""
+        if self.is_one_time_cost:
+            return "One-time"
+        if self.is_distributed_instances:
+            return "Distributed"
+        if self.occurrence_years:
+            return "Discrete"
+        return "Recurring"
+
+@functools.lru_cache(maxsize=1024)
+def _intervals_for_timing(timing: TimingView) -> Tuple[Tuple[int, int], ...]:
+    """Compute the year intervals for a TimingView."""
+    if timing.is_one_time_cost and timing.one_time_cost_year:
+        return ((timing.one_time_cost_year, timing.one_time_cost_year),)
+    elif timing.is_interval_based:
+        if timing.interval_start_year and timing.interval_years and timing.projection_end_year is not None:
+            return tuple(_merge_years(_interval_occurrence_years(
+                timing.interval_start_year, timing.interval_years, timing.projection_end_year
+            )))
+    elif timing.occurrence_years:
+        return tuple(_merge_years(timing.occurrence_years))
+    elif timing.start_year and timing.end_year:
+        if timing.start_year <= timing.end_year:
+            return ((timing.start_year, timing.end_year),)
+    elif timing.is_distributed_instances:
+        if timing.start_year and timing.distribution_period_years:
+            return ((timing.start_year, int(timing.start_year + timing.distribution_period_years)),)
+    
+    return ()
+
+def get_service_intervals(service) -> Tuple[Tuple[int, int], ...]:
+    """Get the years when a service occurs as sorted (lo, hi) intervals."""
+    return TimingView.from_service(service).intervals()
+
+@functools.lru_cache(maxsize=1024)
+def _service_year_info(timing: TimingView) -> dict:
+    """Get the year coverage and type fields shown for a service in the unified views."""
+    intervals = timing.intervals()
+    first_year = intervals[0][0] if intervals else None
+    last_year = intervals[-1][1] if intervals else None
+    return {
+        'intervals': intervals,
+        'first_year': first_year,
+        'last_year': last_year,
+        'year_range': f"{first_year}-{last_year}" if intervals else "None",
+        'total_years': sum(hi - lo + 1 for lo, hi in intervals),
+        'service_type': timing.service_type
+    }
 
 def get_service_years(service):
     """Get all years when a service occurs."""
-    years = set()
+    return expand_years(get_service_intervals(service))
+
+def _build_interval_index(table):
+    """Get (starts, ends, indices, max_span) for all service intervals in a table, sorted by start.
     
-    if service.is_one_time_cost and service.one_time_cost_year:
-        years.add(service.one_time_cost_year)
-    elif hasattr(service, 'is_interval_based') and service.is_interval_based:
-        if service.interval_start_year and service.interval_years:
-            # Calculate all interval occurrences within projection period
-            # We need to get the end year from session state
-            if hasattr(st.session_state, 'lcp_data') and st.session_state.lcp_data:
-                base_year = st.session_state.lcp_data.settings.base_year
-                projection_years = st.session_state.lcp_data.settings.projection_years
-                end_year = base_year + int(projection_years)
-                
-                # For decimal intervals, calculate the fractional year positions and round to nearest year
-                current_fractional_year = float(service.interval_start_year)
-                while current_fractional_year <= end_year:
-                    # Round to nearest integer year
-                    occurrence_year = round(current_fractional_year)
-                    if occurrence_year <= end_year:
-                        years.add(occurrence_year)
-                    current_fractional_year += service.interval_years
-    elif service.occurrence_years:
-        years.update(service.occurrence_years)
-    elif service.start_year and service.end_year:
-        years.update(range(service.start_year, service.end_year + 1))
-    elif hasattr(service, 'is_distributed_instances') and service.is_distributed_instances:
-        if service.start_year and service.distribution_period_years:
-            end_year = int(service.start_year + service.distribution_period_years)
-            years.update(range(service.start_year, end_year + 1))
-    
-    return sorted(years)
+    The index is cached in session state and rebuilt only when the table's
+    services or their timing change.
+    """
+    timings = tuple(TimingView.from_service(service) for service in table.services)
+    index_cache = st.session_state.setdefault('_interval_index_cache', {})
+    cached = index_cache.get(table.name)
+    if cached is not None and cached[0] == timings:
+        return cached[1]
+    
+    entries = sorted(
+        (lo, hi, i)
+        for i, timing in enumerate(timings)
+        for lo, hi in timing.intervals()
+    )
+    index = (
+        [lo for lo, _, _ in entries],
+        [hi for _, hi, _ in entries],
+        [i for _, _, i in entries],
+        max((hi - lo for lo, hi, _ in entries), default=0),
+    )
+    index_cache[table.name] = (timings, index)
+    return index
 
 def check_service_overlaps(new_service_data, table_name, exclude_service_index=None):
     """Check for overlaps between a new/edited service and existing services in the same table."""
     overlaps = []
     
-    if table_name not in st.session_state.lcp_data.tables:
+    table = st.session_state.lcp_data.tables.get(table_name)
+    if table is None:
         return overlaps
     
-    table = st.session_state.lcp_data.tables[table_name]
-    
-    # Get years for the new/edited service
-    new_years = set()
+    # Get year intervals for the new/edited service
+    new_intervals = TimingView.from_service(new_service_data).intervals()
+    if not new_intervals:
+        # Nothing to compare until the timing fields are filled in
+        return overlaps
     
-    if new_service_data.get('is_one_time_cost') and new_service_data.get('one_time_cost_year'):
-        new_years.add(new_service_data['one_time_cost_year'])
-    elif new_service_data.get('is_interval_based'):
-        if new_service_data.get('interval_start_year') and new_service_data.get('interval_years'):
-            # Calculate all interval occurrences within projection period
-            base_year = st.session_state.lcp_data.settings.base_year
-            projection_years = st.session_state.lcp_data.settings.projection_years
-            end_year = base_year + int(projection_years)
-            
-            # For decimal intervals, calculate the fractional year positions and round to nearest year
-            current_fractional_year = float(new_service_data['interval_start_year'])
-            while current_fractional_year <= end_year:
-                # Round to nearest integer year
-                occurrence_year = round(current_fractional_year)
-                if occurrence_year <= end_year:
-                    new_years.add(occurrence_year)
-                current_fractional_year += new_service_data['interval_years']
-    elif new_service_data.get('occurrence_years'):
-        new_years.update(new_service_data['occurrence_years'])
-    elif new_service_data.get('start_year') and new_service_data.get('end_year'):
-        new_years.update(range(new_service_data['start_year'], new_service_data['end_year'] + 1))
-    elif new_service_data.get('is_distributed_instances'):
-        if new_service_data.get('start_year') and new_service_data.get('distribution_period_years'):
-            end_year = int(new_service_data['start_year'] + new_service_data['distribution_period_years'])
-            new_years.update(range(new_service_data['start_year'], end_year + 1))
-    
-    # Check against existing services
-    for i, existing_service in enumerate(table.services):
-        if exclude_service_index is not None and i == exclude_service_index:
-            continue  # Skip the service being edited
-            
-        existing_years = set(get_service_years(existing_service))
-        overlap_years = new_years.intersection(existing_years)
-        
-        if overlap_years:
-            overlaps.append({
-                'service_name': existing_service.name,
-                'service_index': i,
-                'overlap_years': sorted(overlap_years)
-            })
+    # Sweep the table's sorted interval index instead of intersecting every service
+    starts, ends, indices, max_span = _build_interval_index(table)
+    overlap_parts = {}
+    for new_lo, new_hi in new_intervals:
+        # Only intervals starting at or before new_hi can overlap; none starting before
+        # new_lo - max_span can reach new_lo, so the reverse scan stops there
+        j = bisect.bisect_right(starts, new_hi) - 1
+        while j >= 0 and starts[j] >= new_lo - max_span:
+            if ends[j] >= new_lo and indices[j] != exclude_service_index:
+                overlap_parts.setdefault(indices[j], []).append((max(starts[j], new_lo), min(ends[j], new_hi)))
+            j -= 1
+    
+    for i in sorted(overlap_parts):
+        # Only materialize concrete years when there is something to report
+        overlaps.append({
+            'service_name': table.services[i].name,
+            'service_index': i,
+            'overlap_years': expand_years(sorted(overlap_parts[i]))
+        })
     
     return overlaps
 
@@ -167,72 +348,137 @@ def show_manage_services_page():
     with tab4:
         show_unified_view_edit()
 
+# Number of tables shown expanded by default in the overview
+OVERVIEW_EXPANDED_TABLES = 5
+
+# Number of service groups shown expanded by default in the unified views
+UNIFIED_EXPANDED_GROUPS = 5
+
 def show_tables_overview():
     """Show overview of all service tables."""
     st.subheader("Service Tables Overview")
     
-    if not st.session_state.lcp_data.tables:
+    tables = st.session_state.lcp_data.tables
+    if not tables:
         st.info("No service tables created yet. Use the 'Add Table' tab to create your first table.")
         return
     
-    # Display tables in a nice format
-    for table_name, table in st.session_state.lcp_data.tables.items():
-        with st.expander(f"📋 {table_name} ({len(table.services)} services)", expanded=True):
-            if table.services:
-                # Create DataFrame for display
-                services_data = []
-                for i, service in enumerate(table.services):
-                    if service.is_one_time_cost:
-                        service_type = "One-time"
-                        timing = f"Year {service.one_time_cost_year}"
-                    elif hasattr(service, 'is_interval_based') and service.is_interval_based:
-                        if service.interval_years == int(service.interval_years):
-                            service_type = f"Every {int(service.interval_years)} years"
-                            timing = f"Starting {service.interval_start_year}, every {int(service.interval_years)} years"
-                        else:
-                            service_type = f"Every {service.interval_years:.1f} years"
-                            timing = f"Starting {service.interval_start_year}, every {service.interval_years:.1f} years"
-                    elif service.occurrence_years:
-                        service_type = "Discrete"
-                        timing = f"Years: {', '.join(map(str, service.occurrence_years))}"
-                    else:
-                        service_type = "Recurring"
-                        timing = f"{service.start_year} - {service.end_year}"
+    # Display tables in a nice format. An expander still runs its body when collapsed,
+    # so use toggles and only build the DataFrame for tables that are switched on.
+    for position, (table_name, table) in enumerate(tables.items()):
+        with st.container(border=True):
+            _show_table_overview(table_name, table, position < OVERVIEW_EXPANDED_TABLES)
 
-                    # Handle cost display
-                    if service.use_cost_range:
-                        cost_display = f"${service.unit_cost:,.2f} (Range: ${service.cost_range_low:,.2f} - ${service.cost_range_high:,.2f})"
-                    else:
-                        cost_display = f"${service.unit_cost:,.2f}"
-
-                    services_data.append({
-                        "Service": service.name,
-                        "Type": service_type,
-                        "Cost": cost_display,
-                        "Frequency/Year": f"{service.frequency_per_year:.1f}",
-                        "Inflation Rate": f"{service.inflation_rate:.1%}",
-                        "Timing": timing
-                    })
-                
-                df = pd.DataFrame(services_data)
-                st.dataframe(df, use_container_width=True, hide_index=True)
-                
-                # Delete table button
-                if st.button(f"🗑️ Delete {table_name} Table", key=f"delete_table_{table_name}"):
-                    if st.session_state.get(f"confirm_delete_{table_name}", False):
-                        del st.session_state.lcp_data.tables[table_name]
-                        st.success(f"Deleted table: {table_name}")
-                        st.rerun()
-                    else:
-                        st.session_state[f"confirm_delete_{table_name}"] = True
-                        st.warning("Click again to confirm deletion")
+@st.fragment
+def _show_table_overview(table_name: str, table: ServiceTable, expanded_by_default: bool):
+    """Show one table of the overview.
+    
+    Runs as a fragment so switching the table on or off, or the first click of the
+    delete confirmation, only reruns this table.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
+    expanded = st.toggle(
+        f"📋 {table_name} ({len(table.services)} services)",
+        value=expanded_by_default,
+        key=f"overview_expanded_{table_name}"
+    )
+    if not expanded:
+        return
+    
+    if table.services:
+        df = _build_services_df(_services_df_signature(table))
+        st.dataframe(df, use_container_width=True, hide_index=True,
+                     column_config=_OVERVIEW_COLUMN_CONFIG)
+        
+        # Delete table button
+        if st.button(f"🗑️ Delete {table_name} Table", key=f"delete_table_{table_name}"):
+            if st.session_state.get(f"confirm_delete_{table_name}", False):
+                del st.session_state.lcp_data.tables[table_name]
+                st.success(f"Deleted table: {table_name}")
+                st.rerun(scope="app")
+            else:
+                st.session_state[f"confirm_delete_{table_name}"] = True
+                st.warning("Click again to confirm deletion")
+    else:
+        st.info("No services in this table yet.")
+
+def _services_df_signature(table) -> tuple:
+    """Build a hashable tuple of the displayed fields of every service in a table."""
+    return tuple(
+        (
+            service.name, service.unit_cost, service.use_cost_range,
+            service.cost_range_low, service.cost_range_high,
+            service.frequency_per_year, service.inflation_rate,
+            service.is_one_time_cost, service.one_time_cost_year,
+            tuple(service.occurrence_years or ()), service.start_year, service.end_year,
+            service.is_interval_based, service.interval_years, service.interval_start_year,
+        )
+        for service in table.services
+    )
+
+# Display formats of the numeric columns of the overview DataFrame
+_OVERVIEW_COLUMN_CONFIG = {
+    "Frequency/Year": st.column_config.NumberColumn(format="%.1f"),
+    "Inflation Rate": st.column_config.NumberColumn(format="%.1f%%"),
+}
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_services_df(signature) -> pd.DataFrame:
+    """Build the overview DataFrame for a table from its _services_df_signature."""
+    # Collect each column as a flat list and build the DataFrame in one go
+    names, service_types, cost_displays, frequencies, inflation_rates, timings = [], [], [], [], [], []
+    for (name, unit_cost, use_cost_range, cost_range_low, cost_range_high,
+         frequency_per_year, inflation_rate, is_one_time_cost, one_time_cost_year,
+         occurrence_years, start_year, end_year,
+         is_interval_based, interval_years, interval_start_year) in signature:
+        if is_one_time_cost:
+            service_type = "One-time"
+            timing = f"Year {one_time_cost_year}"
+        elif is_interval_based:
+            if interval_years == int(interval_years):
+                service_type = f"Every {int(interval_years)} years"
+                timing = f"Starting {interval_start_year}, every {int(interval_years)} years"
             else:
-                st.info("No services in this table yet.")
+                service_type = f"Every {interval_years:.1f} years"
+                timing = f"Starting {interval_start_year}, every {interval_years:.1f} years"
+        elif occurrence_years:
+            service_type = "Discrete"
+            timing = f"Years: {', '.join(map(str, occurrence_years))}"
+        else:
+            service_type = "Recurring"
+            timing = f"{start_year} - {end_year}"
+
+        # Handle cost display
+        if use_cost_range:
+            cost_display = f"${unit_cost:,.2f} (Range: ${cost_range_low:,.2f} - ${cost_range_high:,.2f})"
+        else:
+            cost_display = f"${unit_cost:,.2f}"
+
+        names.append(name)
+        service_types.append(service_type)
+        cost_displays.append(cost_display)
+        frequencies.append(frequency_per_year)
+        inflation_rates.append(inflation_rate)
+        timings.append(timing)
+    
+    # Numeric columns stay float so they ship to the browser as numbers;
+    # _OVERVIEW_COLUMN_CONFIG formats them for display
+    return pd.DataFrame({
+        "Service": names,
+        "Type": service_types,
+        "Cost": cost_displays,
+        "Frequency/Year": pd.Series(frequencies, dtype="float64"),
+        "Inflation Rate": pd.Series(inflation_rates, dtype="float64") * 100,
+        "Timing": timings
+    })
 
 def show_add_table_form():
     """Show form to add a new service table."""
     st.subheader("Add New Service Table")
     
+    lcp = st.session_state.lcp_data
+    
     with st.form("add_table_form"):
         table_name = st.text_input(
             "Table Name *",
@@ -256,22 +502,16 @@ def show_add_table_form():
                 st.error("Please enter a table name.")
                 return
             
-            if table_name in st.session_state.lcp_data.tables:
+            if table_name in lcp.tables:
                 st.error(f"Table '{table_name}' already exists.")
                 return
             
             try:
-                table = ServiceTable(name=table_name.strip())
-                table.default_inflation_rate = default_inflation_rate / 100  # Store as decimal
-                st.session_state.lcp_data.add_table(table)
+                table = ServiceTable(name=table_name.strip(), default_inflation_rate=default_inflation_rate / 100)
+                lcp.add_table(table)
 
                 # Auto-save to database if enabled
-                if st.session_state.get('auto_save', True):
-                    try:
-                        db.save_life_care_plan(st.session_state.lcp_data)
-                        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                    except Exception as e:
-                        st.warning(f"Auto-save failed: {str(e)}")
+                schedule_save()
 
                 st.success(f"✅ Created table: {table_name}")
                 st.rerun()
@@ -283,79 +523,218 @@ def show_service_management():
     """Show service management interface."""
     st.subheader("Add/Edit Services")
     
-    if not st.session_state.lcp_data.tables:
+    tables = st.session_state.lcp_data.tables
+    if not tables:
         st.warning("Please create at least one service table first.")
         return
     
     # Select table
-    table_names = list(st.session_state.lcp_data.tables.keys())
-    selected_table = st.selectbox("Select Table", table_names)
+    selected_table = st.selectbox("Select Table", list(tables))
     
     if not selected_table:
         return
     
-    table = st.session_state.lcp_data.tables[selected_table]
+    table = tables[selected_table]
     
     # Show existing services with edit/delete options
     if table.services:
-        st.markdown("### Existing Services")
-        for i, service in enumerate(table.services):
-            with st.expander(f"🔧 {service.name}", expanded=False):
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    # Display cost information
-                    if service.use_cost_range:
-                        st.write(f"**Cost:** ${service.unit_cost:,.2f} (avg)")
-                        st.write(f"**Range:** ${service.cost_range_low:,.2f} - ${service.cost_range_high:,.2f}")
-                    else:
-                        st.write(f"**Cost:** ${service.unit_cost:,.2f}")
-
-                    # Display frequency information
-                    if hasattr(service, 'is_distributed_instances') and service.is_distributed_instances:
-                        st.write(f"**Frequency:** {service.frequency_per_year:.2f}/year ({service.total_instances}x total)")
-                    else:
-                        st.write(f"**Frequency:** {service.frequency_per_year:.1f}/year")
-                    st.write(f"**Inflation:** {service.inflation_rate:.1%}")
-
-                    # Display service type information
-                    if service.is_one_time_cost:
-                        st.write(f"**Type:** One-time cost in {service.one_time_cost_year}")
-                    elif service.occurrence_years:
-                        years_display = ', '.join(map(str, service.occurrence_years))
-                        if len(years_display) > 50:  # Truncate if too long
-                            years_display = years_display[:47] + "..."
-                        st.write(f"**Type:** Specific years: {years_display}")
-                    elif hasattr(service, 'is_distributed_instances') and service.is_distributed_instances:
-                        st.write(f"**Type:** {service.total_instances} instances over {service.distribution_period_years:.1f} years")
-                        st.write(f"**Period:** {service.start_year} to {service.start_year + service.distribution_period_years:.0f}")
-                    else:
-                        st.write(f"**Type:** Recurring from {service.start_year} to {service.end_year}")
-                
-                with col2:
-                    if st.button("✏️ Edit", key=f"edit_{i}"):
-                        st.session_state[f"editing_service_{i}"] = True
-                        st.rerun()
-                    
-                    if st.button("🗑️ Delete", key=f"delete_{i}"):
-                        if st.session_state.get(f"confirm_delete_service_{i}", False):
-                            table.services.pop(i)
-                            st.success(f"Deleted service: {service.name}")
-                            st.rerun()
-                        else:
-                            st.session_state[f"confirm_delete_service_{i}"] = True
-                            st.warning("Click again to confirm")
-                
-                # Show edit form if editing
-                if st.session_state.get(f"editing_service_{i}", False):
-                    show_edit_service_form(table, i, service)
+        show_existing_services(table)
     
     # Add new service form
     st.markdown("### Add New Service")
     show_add_service_form(table)
 
+def _shift_service_toggles(table_name: str, deleted_index: int, service_count: int):
+    """Move the expanded state of the services after a deleted one up one index.
+    
+    Runs before the toggles are created, as a widget's state cannot be set once it is
+    on the page.
+    """
+    for j in range(deleted_index, service_count):
+        st.session_state[f"service_expanded_{table_name}_{j}"] = st.session_state.get(
+            f"service_expanded_{table_name}_{j + 1}", False)
+    st.session_state.pop(f"service_expanded_{table_name}_{service_count}", None)
+
+@st.fragment
+def show_existing_services(table: ServiceTable):
+    """Show existing services with edit/delete options.
+    
+    Runs as a fragment so opening an editor only reruns this list.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
+    st.markdown("### Existing Services")
+    # (table name, service index) of every service whose edit form is open
+    editing_services = st.session_state.setdefault('_editing_services', set())
+    # A delete on the previous run left the toggles of later services to move up
+    deleted = st.session_state.get('_deleted_service')
+    if deleted is not None and deleted[0] == table.name:
+        del st.session_state['_deleted_service']
+        _shift_service_toggles(table.name, deleted[1], len(table.services))
+    # Toggles rather than expanders, so collapsed services build no details or buttons
+    for i, service in enumerate(table.services):
+        with st.container(border=True):
+            if not st.toggle(f"🔧 {service.name}", value=False, key=f"service_expanded_{table.name}_{i}"):
+                continue
+            
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                # Display cost information
+                if service.use_cost_range:
+                    details = [
+                        f"**Cost:** ${service.unit_cost:,.2f} (avg)",
+                        f"**Range:** ${service.cost_range_low:,.2f} - ${service.cost_range_high:,.2f}",
+                    ]
+                else:
+                    details = [f"**Cost:** ${service.unit_cost:,.2f}"]
+
+                # Display frequency information
+                if service.is_distributed_instances:
+                    details.append(f"**Frequency:** {service.frequency_per_year:.2f}/year ({service.total_instances}x total)")
+                else:
+                    details.append(f"**Frequency:** {service.frequency_per_year:.1f}/year")
+                details.append(f"**Inflation:** {service.inflation_rate:.1%}")
+
+                # Display service type information
+                if service.is_one_time_cost:
+                    details.append(f"**Type:** One-time cost in {service.one_time_cost_year}")
+                elif service.occurrence_years:
+                    details.append(f"**Type:** Specific years: {_years_display(tuple(service.occurrence_years))}")
+                elif service.is_distributed_instances:
+                    details.append(f"**Type:** {service.total_instances} instances over {service.distribution_period_years:.1f} years")
+                    details.append(f"**Period:** {service.start_year} to {service.start_year + service.distribution_period_years:.0f}")
+                else:
+                    details.append(f"**Type:** Recurring from {service.start_year} to {service.end_year}")
+                
+                # One markdown element per service rather than one per line
+                st.markdown("  \n".join(details))
+            
+            with col2:
+                if st.button("✏️ Edit", key=f"edit_{i}"):
+                    # The edit form below picks this up in the same fragment run
+                    editing_services.add((table.name, i))
+                
+                if st.button("🗑️ Delete", key=f"delete_{i}"):
+                    # The pending confirmation holds the service itself rather than its
+                    # index, so it cannot carry over to the service that moves into it
+                    if st.session_state.get('_pending_service_delete') is service:
+                        del st.session_state['_pending_service_delete']
+                        table.services.pop(i)
+                        # Later services move up one index; keep their open editors with them,
+                        # and their toggles once the rerun reaches this list again
+                        st.session_state._editing_services = {
+                            (name, j - 1 if name == table.name and j > i else j)
+                            for name, j in editing_services
+                            if (name, j) != (table.name, i)
+                        }
+                        st.session_state._deleted_service = (table.name, i)
+                        st.success(f"Deleted service: {service.name}")
+                        st.rerun(scope="app")
+                    else:
+                        st.session_state._pending_service_delete = service
+                        st.warning("Click again to confirm")
+            
+            # Show edit form if editing
+            if (table.name, i) in editing_services:
+                show_edit_service_form(table, i, service)
+
+# Help texts shared by the add and edit service forms
+_COST_RANGE_HELP = "Enter a high and low cost estimate - the average will be used as the unit cost"
+_FREQUENCY_HELP = (
+    "How many times per year this service occurs. Examples:\n• 1.0 = Once per year\n• 0.5 = Every 2 years\n"
+    "• 1.5 = Every 1.5 years\n• 0.33 = Every 3 years\n• 0.25 = Every 4 years"
+)
+_FREQUENCY_HELP_DISTRIBUTED = _FREQUENCY_HELP + "\n\nNote: For 'Distributed Instances' this will be calculated automatically."
+_SELECT_YEARS_HELP = "Select all years when this service will occur"
+
+class ServiceTiming(IntEnum):
+    """Service types offered by the add-service form, in radio order."""
+    RECURRING = 0
+    DISCRETE = 1
+    ONE_TIME = 2
+    SPECIFIC = 3
+    DISTRIBUTED = 4
+    INTERVAL = 5
+
+_TIMING_LABELS = (
+    "Recurring",
+    "Discrete Occurrences",
+    "One-time Cost",
+    "Specific Years",
+    "Distributed Instances",
+    "Interval Based (Every X Years)",
+)
+
+def _recurring_timing(start_year, end_year):
+    return {"start_year": start_year, "end_year": end_year}
+
+def _discrete_timing(occurrence_years_str):
+    if not occurrence_years_str.strip():
+        raise ValueError("Please enter occurrence years.")
+    occurrence_years = _parse_years(occurrence_years_str)
+    if occurrence_years is None:
+        raise ValueError("Invalid occurrence years format. Use comma-separated years (e.g., 2025, 2030, 2035)")
+    return {"occurrence_years": sorted(set(occurrence_years))}
+
+def _specific_timing(selected_years):
+    if not selected_years:
+        raise ValueError("Please select at least one year.")
+    return {"occurrence_years": sorted(selected_years)}
+
+def _distributed_timing(total_instances, distribution_period, distribution_start_year):
+    if total_instances <= 0:
+        raise ValueError("Total instances must be greater than zero.")
+    if distribution_period <= 0:
+        raise ValueError("Distribution period must be greater than zero.")
+    return {
+        "is_distributed_instances": True,
+        "total_instances": total_instances,
+        "distribution_period_years": distribution_period,
+        "start_year": distribution_start_year,
+        "end_year": int(distribution_start_year + distribution_period),
+        "frequency_per_year": total_instances / distribution_period  # This will be calculated in __post_init__
+    }
+
+def _interval_timing(interval_years, interval_start_year, base_year):
+    if interval_years <= 0:
+        raise ValueError("Interval years must be greater than zero.")
+    if interval_start_year < base_year:
+        raise ValueError("Start year cannot be before the base year.")
+    return {
+        "is_interval_based": True,
+        "interval_years": interval_years,
+        "interval_start_year": interval_start_year,
+        "frequency_per_year": 1.0 / interval_years  # This will be calculated in __post_init__
+    }
+
+def _one_time_timing(one_time_year):
+    return {"is_one_time_cost": True, "one_time_cost_year": one_time_year}
+
+# Each builder validates the form inputs for its service type and returns the
+# Service timing fields, raising ValueError with a user-facing message
+_TIMING_BUILDERS = {
+    ServiceTiming.RECURRING: _recurring_timing,
+    ServiceTiming.DISCRETE: _discrete_timing,
+    ServiceTiming.ONE_TIME: _one_time_timing,
+    ServiceTiming.SPECIFIC: _specific_timing,
+    ServiceTiming.DISTRIBUTED: _distributed_timing,
+    ServiceTiming.INTERVAL: _interval_timing,
+}
+
+@st.fragment
 def show_add_service_form(table: ServiceTable):
     """Show form to add a new service."""
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
+    lcp = st.session_state.lcp_data
+    settings = lcp.settings
+    base_year = settings.base_year
+    proj_years = settings.projection_years
+    current_age = lcp.evaluee.current_age
+    # Table defaults are stored as decimals; keep the suggestion within the input's range
+    default_inflation = max(0.0, min(table.default_inflation_rate * 100, 20.0))
+
     with st.form(f"add_service_form_{table.name}"):
         service_name = st.text_input(
             "Service Name *",
@@ -366,7 +745,7 @@ def show_add_service_form(table: ServiceTable):
         st.subheader("Cost Information")
         use_cost_range = st.checkbox(
             "Use Cost Range (High/Low)",
-            help="Enter a high and low cost estimate - the average will be used as the unit cost"
+            help=_COST_RANGE_HELP
         )
 
         col1, col2 = st.columns(2)
@@ -417,7 +796,7 @@ def show_add_service_form(table: ServiceTable):
                 value=1.0,
                 step=0.1,
                 format="%.2f",
-                help="How many times per year this service occurs. Examples:\n• 1.0 = Once per year\n• 0.5 = Every 2 years\n• 1.5 = Every 1.5 years\n• 0.33 = Every 3 years\n• 0.25 = Every 4 years\n\nNote: For 'Distributed Instances' this will be calculated automatically."
+                help=_FREQUENCY_HELP_DISTRIBUTED
             )
 
             # Show frequency interpretation
@@ -430,23 +809,11 @@ def show_add_service_form(table: ServiceTable):
                 st.caption("💡 This means once per year")
 
         with col4:
-            # Handle default inflation rate - check if it's already in percentage format
-            # Handle inflation rate conversion safely
-            default_inflation = getattr(table, 'default_inflation_rate', 0.035)
-            try:
-                default_inflation = float(default_inflation)
-                if default_inflation <= 1.0:  # Likely stored as decimal (0.035 = 3.5%)
-                    default_inflation = default_inflation * 100
-                # Ensure it's within reasonable bounds
-                default_inflation = max(0.0, min(default_inflation, 20.0))
-            except (ValueError, TypeError):
-                default_inflation = 3.5  # Fallback to 3.5%
-
             inflation_rate = st.number_input(
                 "Inflation Rate (%) *",
                 min_value=0.0,
                 max_value=20.0,
-                value=min(default_inflation, 20.0),  # Cap at 20% to avoid validation error
+                value=default_inflation,
                 step=0.1,
                 help="Annual inflation rate for this service"
             )
@@ -455,23 +822,24 @@ def show_add_service_form(table: ServiceTable):
         st.subheader("Service Timing")
         service_type = st.radio(
             "Service Type",
-            ["Recurring", "Discrete Occurrences", "One-time Cost", "Specific Years", "Distributed Instances", "Interval Based (Every X Years)"],
+            list(ServiceTiming),
+            format_func=_TIMING_LABELS.__getitem__,
             help="How often this service occurs"
         )
         
-        if service_type == "Recurring":
+        if service_type == ServiceTiming.RECURRING:
             col1, col2 = st.columns(2)
             with col1:
                 start_year = st.number_input(
                     "Start Year",
-                    min_value=st.session_state.lcp_data.settings.base_year,
-                    value=st.session_state.lcp_data.settings.base_year,
+                    min_value=base_year,
+                    value=base_year,
                     step=1
                 )
                 # Display age for start year
                 start_age = calculate_age_for_year(
-                    st.session_state.lcp_data.settings.base_year,
-                    st.session_state.lcp_data.evaluee.current_age,
+                    base_year,
+                    current_age,
                     start_year
                 )
                 st.caption(f"📅 Starting age: **{start_age:.1f} years old**")
@@ -480,13 +848,13 @@ def show_add_service_form(table: ServiceTable):
                 end_year = st.number_input(
                     "End Year",
                     min_value=start_year,
-                    value=int(st.session_state.lcp_data.settings.base_year + st.session_state.lcp_data.settings.projection_years) - 1,
+                    value=int(base_year + proj_years) - 1,
                     step=1
                 )
                 # Display age for end year
                 end_age = calculate_age_for_year(
-                    st.session_state.lcp_data.settings.base_year,
-                    st.session_state.lcp_data.evaluee.current_age,
+                    base_year,
+                    current_age,
                     end_year
                 )
                 st.caption(f"📅 Ending age: **{end_age:.1f} years old**")
@@ -496,7 +864,9 @@ def show_add_service_form(table: ServiceTable):
                 duration = end_year - start_year + 1
                 st.info(f"⏱️ Service duration: **{duration} years** (age {start_age:.1f} to {end_age:.1f})")
 
-        elif service_type == "Discrete Occurrences":
+            timing_inputs = {"start_year": start_year, "end_year": end_year}
+
+        elif service_type == ServiceTiming.DISCRETE:
             occurrence_years_str = st.text_input(
                 "Occurrence Years",
                 placeholder="e.g., 2025, 2030, 2035",
@@ -505,33 +875,28 @@ def show_add_service_form(table: ServiceTable):
             
             # Display ages for entered years
             if occurrence_years_str:
-                try:
-                    occurrence_years = [int(year.strip()) for year in occurrence_years_str.split(',')]
+                occurrence_years = _parse_years(occurrence_years_str)
+                if occurrence_years is not None:
                     display_age_info(
                         occurrence_years,
-                        st.session_state.lcp_data.evaluee.current_age,
-                        st.session_state.lcp_data.settings.base_year
+                        current_age,
+                        base_year
                     )
-                except ValueError:
+                else:
                     st.warning("Please enter valid years separated by commas")
 
-        elif service_type == "Specific Years":
+            timing_inputs = {"occurrence_years_str": occurrence_years_str}
+
+        elif service_type == ServiceTiming.SPECIFIC:
             st.markdown("**Select Specific Years:**")
             st.caption("Choose individual years from the projection period when this service will occur")
 
-            # Create year range for selection
-            base_year = st.session_state.lcp_data.settings.base_year
-            end_year = base_year + int(st.session_state.lcp_data.settings.projection_years)
-            if st.session_state.lcp_data.settings.projection_years % 1 != 0:
-                end_year += 1
-            available_years = list(range(base_year, end_year))
-
             # Multi-select for years
             selected_years = st.multiselect(
                 "Select Years",
-                options=available_years,
+                options=_available_years(base_year, proj_years),
                 default=[base_year],
-                help="Select all years when this service will occur"
+                help=_SELECT_YEARS_HELP
             )
 
             if selected_years:
@@ -539,11 +904,13 @@ def show_add_service_form(table: ServiceTable):
                 # Display ages for selected years
                 display_age_info(
                     selected_years,
-                    st.session_state.lcp_data.evaluee.current_age,
-                    st.session_state.lcp_data.settings.base_year
+                    current_age,
+                    base_year
                 )
 
-        elif service_type == "Distributed Instances":
+            timing_inputs = {"selected_years": selected_years}
+
+        elif service_type == ServiceTiming.DISTRIBUTED:
             st.markdown("**Total Instances Spread Over Period:**")
             st.caption("Enter the total number of times this service will occur, spread evenly over a specified period")
             
@@ -579,8 +946,8 @@ def show_add_service_form(table: ServiceTable):
             # Start year for distribution
             distribution_start_year = st.number_input(
                 "Start Year for Distribution",
-                min_value=st.session_state.lcp_data.settings.base_year,
-                value=st.session_state.lcp_data.settings.base_year,
+                min_value=base_year,
+                value=base_year,
                 step=1,
                 help="Year when the distributed instances begin"
             )
@@ -588,18 +955,24 @@ def show_add_service_form(table: ServiceTable):
             # Display age information for distribution period
             distribution_end_year = distribution_start_year + distribution_period
             start_age = calculate_age_for_year(
-                st.session_state.lcp_data.settings.base_year,
-                st.session_state.lcp_data.evaluee.current_age,
+                base_year,
+                current_age,
                 distribution_start_year
             )
             end_age = calculate_age_for_year(
-                st.session_state.lcp_data.settings.base_year,
-                st.session_state.lcp_data.evaluee.current_age,
+                base_year,
+                current_age,
                 int(distribution_end_year)
             )
             st.caption(f"📅 Distribution period: Age {start_age:.1f} to {end_age:.1f} ({distribution_start_year} to {distribution_end_year:.1f})")
+
+            timing_inputs = {
+                "total_instances": total_instances,
+                "distribution_period": distribution_period,
+                "distribution_start_year": distribution_start_year
+            }
             
-        elif service_type == "Interval Based (Every X Years)":
+        elif service_type == ServiceTiming.INTERVAL:
             st.markdown("**Interval-Based Service Configuration:**")
             st.caption("Service occurs at regular intervals (e.g., every 5-7 years)")
             
@@ -617,16 +990,14 @@ def show_add_service_form(table: ServiceTable):
             with col2:
                 interval_start_year = st.number_input(
                     "First Occurrence Year *",
-                    min_value=st.session_state.lcp_data.settings.base_year,
-                    value=st.session_state.lcp_data.settings.base_year,
+                    min_value=base_year,
+                    value=base_year,
                     step=1,
                     help="Year of the first occurrence"
                 )
             
             # Calculate and display all occurrences within projection period
-            base_year = st.session_state.lcp_data.settings.base_year
-            projection_years = st.session_state.lcp_data.settings.projection_years
-            end_year = base_year + int(projection_years)
+            end_year = base_year + int(proj_years)
             
             occurrence_years_preview = []
             current_fractional_year = float(interval_start_year)
@@ -646,28 +1017,36 @@ def show_add_service_form(table: ServiceTable):
                 # Display ages for interval occurrences
                 display_age_info(
                     occurrence_years_preview,
-                    st.session_state.lcp_data.evaluee.current_age,
-                    st.session_state.lcp_data.settings.base_year
+                    current_age,
+                    base_year
                 )
                 
                 # Show frequency info
                 if len(occurrence_years_preview) > 1:
                     avg_frequency = len(occurrence_years_preview) / (occurrence_years_preview[-1] - occurrence_years_preview[0] + 1)
                     st.caption(f"💡 Average frequency: {avg_frequency:.3f} occurrences per year")
+
+            timing_inputs = {
+                "interval_years": interval_years,
+                "interval_start_year": interval_start_year,
+                "base_year": base_year
+            }
             
-        else:  # One-time cost
+        else:  # ServiceTiming.ONE_TIME
             one_time_year = st.number_input(
                 "Year of Occurrence",
-                min_value=st.session_state.lcp_data.settings.base_year,
-                value=st.session_state.lcp_data.settings.base_year,
+                min_value=base_year,
+                value=base_year,
                 step=1
             )
             # Display age for one-time cost year
             display_age_info(
                 one_time_year,
-                st.session_state.lcp_data.evaluee.current_age,
-                st.session_state.lcp_data.settings.base_year
+                current_age,
+                base_year
             )
+
+            timing_inputs = {"one_time_year": one_time_year}
         
         submitted = st.form_submit_button("➕ Add Service", use_container_width=True)
         
@@ -676,47 +1055,14 @@ def show_add_service_form(table: ServiceTable):
                 st.error("Please enter a service name.")
                 return
             
-            # Prepare service data for overlap checking
-            overlap_check_data = {
-                "name": service_name.strip(),
-                "start_year": None,
-                "end_year": None,
-                "occurrence_years": None,
-                "is_one_time_cost": False,
-                "one_time_cost_year": None,
-                "is_distributed_instances": False,
-                "distribution_period_years": None,
-                "is_interval_based": False,
-                "interval_years": None,
-                "interval_start_year": None
-            }
-            
-            # Set timing data based on service type
-            if service_type == "Recurring":
-                overlap_check_data["start_year"] = start_year
-                overlap_check_data["end_year"] = end_year
-            elif service_type == "Discrete Occurrences":
-                if occurrence_years_str:
-                    try:
-                        overlap_check_data["occurrence_years"] = [int(year.strip()) for year in occurrence_years_str.split(',')]
-                    except ValueError:
-                        st.error("Please enter valid years separated by commas.")
-                        return
-            elif service_type == "Specific Years":
-                overlap_check_data["occurrence_years"] = selected_years
-            elif service_type == "Distributed Instances":
-                overlap_check_data["is_distributed_instances"] = True
-                overlap_check_data["start_year"] = distribution_start_year
-                overlap_check_data["distribution_period_years"] = distribution_period
-            elif service_type == "Interval Based (Every X Years)":
-                overlap_check_data["is_interval_based"] = True
-                overlap_check_data["interval_years"] = interval_years
-                overlap_check_data["interval_start_year"] = interval_start_year
-            else:  # One-time cost
-                overlap_check_data["is_one_time_cost"] = True
-                overlap_check_data["one_time_cost_year"] = one_time_year
+            try:
+                timing_params = _TIMING_BUILDERS[service_type](**timing_inputs)
+            except ValueError as e:
+                st.error(str(e))
+                return
             
             # Check for overlaps
+            overlap_check_data = {"name": service_name.strip(), **timing_params}
             overlaps = check_service_overlaps(overlap_check_data, table.name)
             
             # Display overlap warnings but allow user to proceed
@@ -756,87 +1102,36 @@ def show_add_service_form(table: ServiceTable):
                     service_params["unit_cost"] = unit_cost
 
                 # Handle service timing
-                if service_type == "Recurring":
-                    service_params.update({
-                        "start_year": start_year,
-                        "end_year": end_year
-                    })
-                elif service_type == "Discrete Occurrences":
-                    if not occurrence_years_str.strip():
-                        st.error("Please enter occurrence years.")
-                        return
-
-                    try:
-                        occurrence_years = [int(year.strip()) for year in occurrence_years_str.split(",")]
-                        if not occurrence_years:
-                            st.error("No valid years found in occurrence years.")
-                            return
-                        service_params["occurrence_years"] = occurrence_years
-                    except ValueError:
-                        st.error("Invalid occurrence years format. Use comma-separated years (e.g., 2025, 2030, 2035)")
-                        return
-                elif service_type == "Specific Years":
-                    if not selected_years:
-                        st.error("Please select at least one year.")
-                        return
-                    service_params["occurrence_years"] = sorted(selected_years)
-                elif service_type == "Distributed Instances":
-                    if total_instances <= 0:
-                        st.error("Total instances must be greater than zero.")
-                        return
-                    if distribution_period <= 0:
-                        st.error("Distribution period must be greater than zero.")
-                        return
-                    
-                    # Set up distributed instance parameters
-                    service_params.update({
-                        "is_distributed_instances": True,
-                        "total_instances": total_instances,
-                        "distribution_period_years": distribution_period,
-                        "start_year": distribution_start_year,
-                        "end_year": int(distribution_start_year + distribution_period),
-                        "frequency_per_year": total_instances / distribution_period  # This will be calculated in __post_init__
-                    })
-                elif service_type == "Interval Based (Every X Years)":
-                    if interval_years <= 0:
-                        st.error("Interval years must be greater than zero.")
-                        return
-                    if interval_start_year < st.session_state.lcp_data.settings.base_year:
-                        st.error("Start year cannot be before the base year.")
-                        return
-                    
-                    # Set up interval-based service parameters
-                    service_params.update({
-                        "is_interval_based": True,
-                        "interval_years": interval_years,
-                        "interval_start_year": interval_start_year,
-                        "frequency_per_year": 1.0 / interval_years  # This will be calculated in __post_init__
-                    })
-                else:  # One-time cost
-                    service_params.update({
-                        "is_one_time_cost": True,
-                        "one_time_cost_year": one_time_year
-                    })
+                service_params.update(timing_params)
                 
                 service = Service(**service_params)
                 table.add_service(service)
 
                 # Auto-save to database if enabled
-                if st.session_state.get('auto_save', True):
-                    try:
-                        db.save_life_care_plan(st.session_state.lcp_data)
-                        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                    except Exception as e:
-                        st.warning(f"Auto-save failed: {str(e)}")
+                schedule_save()
 
                 st.success(f"✅ Added service: {service_name}")
-                st.rerun()
+                st.rerun(scope="app")
                 
             except Exception as e:
                 st.error(f"Error adding service: {str(e)}")
 
+def _close_service_editor(table_name: str, service_index: int):
+    """Close a service's edit form. Used as a button callback, so no extra rerun is needed."""
+    st.session_state._editing_services.discard((table_name, service_index))
+
 def show_edit_service_form(table: ServiceTable, service_index: int, service: Service):
-    """Show form to edit an existing service."""
+    """Show form to edit an existing service.
+    
+    Not a fragment of its own: it runs inside the show_existing_services fragment,
+    whose rerun after a submit is what drops a closed form.
+    """
+    lcp = st.session_state.lcp_data
+    settings = lcp.settings
+    base_year = settings.base_year
+    proj_years = settings.projection_years
+    current_age = lcp.evaluee.current_age
+
     st.markdown("#### Edit Service")
 
     with st.form(f"edit_service_form_{service_index}"):
@@ -848,7 +1143,7 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
         use_cost_range = st.checkbox(
             "Use Cost Range (High/Low)",
             value=service.use_cost_range,
-            help="Enter a high and low cost estimate - the average will be used as the unit cost"
+            help=_COST_RANGE_HELP
         )
 
         col1, col2 = st.columns(2)
@@ -887,7 +1182,7 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
                 min_value=0.1,
                 step=0.1,
                 format="%.2f",
-                help="How many times per year this service occurs. Examples:\n• 1.0 = Once per year\n• 0.5 = Every 2 years\n• 1.5 = Every 1.5 years\n• 0.33 = Every 3 years\n• 0.25 = Every 4 years"
+                help=_FREQUENCY_HELP
             )
 
             # Show frequency interpretation
@@ -900,17 +1195,14 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
                 st.caption("💡 This means once per year")
 
         with col4:
-            # Handle inflation rate - check if it's already in percentage format
-            display_inflation = service.inflation_rate
-            if display_inflation <= 1.0:  # Likely stored as decimal (0.035 = 3.5%)
-                display_inflation = display_inflation * 100
-            # If it's > 1.0, assume it's already in percentage format
-
+            # Rates are stored as decimals. New rates are capped at 20%, but a higher
+            # stored rate stays in range so saving the form never changes it
+            current_inflation = float(service.inflation_rate) * 100
             inflation_rate = st.number_input(
                 "Inflation Rate (%) *",
-                value=float(min(display_inflation, 20.0)),  # Cap at 20% to avoid validation error
+                value=current_inflation,
                 min_value=0.0,
-                max_value=20.0,
+                max_value=max(20.0, current_inflation),
                 step=0.1
             )
         
@@ -923,8 +1215,8 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
             # Display age for one-time cost year
             display_age_info(
                 one_time_year,
-                st.session_state.lcp_data.evaluee.current_age,
-                st.session_state.lcp_data.settings.base_year
+                current_age,
+                base_year
             )
         elif service.occurrence_years:
             st.write("**Current Type:** Discrete Occurrences / Specific Years")
@@ -945,35 +1237,29 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
                 )
                 # Display ages for entered years
                 if occurrence_years_str:
-                    try:
-                        occurrence_years = [int(year.strip()) for year in occurrence_years_str.split(',')]
+                    occurrence_years = _parse_years(occurrence_years_str)
+                    if occurrence_years is not None:
                         display_age_info(
                             occurrence_years,
-                            st.session_state.lcp_data.evaluee.current_age,
-                            st.session_state.lcp_data.settings.base_year
+                            current_age,
+                            base_year
                         )
-                    except ValueError:
+                    else:
                         st.warning("Please enter valid years separated by commas")
             else:
                 # Multi-select for years
-                base_year = st.session_state.lcp_data.settings.base_year
-                end_year = base_year + int(st.session_state.lcp_data.settings.projection_years)
-                if st.session_state.lcp_data.settings.projection_years % 1 != 0:
-                    end_year += 1
-                available_years = list(range(base_year, end_year))
-
                 selected_years = st.multiselect(
                     "Select Years",
-                    options=available_years,
+                    options=_available_years(base_year, proj_years),
                     default=service.occurrence_years,
-                    help="Select all years when this service will occur"
+                    help=_SELECT_YEARS_HELP
                 )
                 # Display ages for selected years
                 if selected_years:
                     display_age_info(
                         selected_years,
-                        st.session_state.lcp_data.evaluee.current_age,
-                        st.session_state.lcp_data.settings.base_year
+                        current_age,
+                        base_year
                     )
         else:
             st.write("**Current Type:** Recurring")
@@ -982,8 +1268,8 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
                 start_year = st.number_input("Start Year", value=int(service.start_year) if service.start_year else 2025, step=1)
                 # Display age for start year
                 start_age = calculate_age_for_year(
-                    st.session_state.lcp_data.settings.base_year,
-                    st.session_state.lcp_data.evaluee.current_age,
+                    base_year,
+                    current_age,
                     start_year
                 )
                 st.caption(f"📅 Starting age: **{start_age:.1f} years old**")
@@ -991,8 +1277,8 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
                 end_year = st.number_input("End Year", value=int(service.end_year) if service.end_year else 2030, step=1)
                 # Display age for end year
                 end_age = calculate_age_for_year(
-                    st.session_state.lcp_data.settings.base_year,
-                    st.session_state.lcp_data.evaluee.current_age,
+                    base_year,
+                    current_age,
                     end_year
                 )
                 st.caption(f"📅 Ending age: **{end_age:.1f} years old**")
@@ -1006,6 +1292,9 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
         with col1:
             if st.form_submit_button("💾 Save Changes", use_container_width=True):
                 try:
+                    # Snapshot the service so a save without changes can be detected
+                    before = astuple(service)
+
                     # Update basic service info
                     service.name = service_name.strip()
                     service.frequency_per_year = frequency_per_year
@@ -1030,41 +1319,49 @@ def show_edit_service_form(table: ServiceTable, service_index: int, service: Ser
                         service.one_time_cost_year = one_time_year
                     elif service.occurrence_years:
                         if edit_mode == "Text Input":
-                            occurrence_years = [int(year.strip()) for year in occurrence_years_str.split(",")]
-                            service.occurrence_years = occurrence_years
+                            occurrence_years = _parse_years(occurrence_years_str)
+                            if occurrence_years is None:
+                                st.error("Invalid occurrence years format. Use comma-separated years (e.g., 2025, 2030, 2035)")
+                                return
+                            service.occurrence_years = sorted(set(occurrence_years))
                         else:
                             service.occurrence_years = sorted(selected_years)
                     else:
                         service.start_year = start_year
                         service.end_year = end_year
 
+                    # Nothing changed: skip the save and the full-app rerun
+                    if astuple(service) == before:
+                        st.toast("No changes to save")
+                        return
+
                     # Auto-save to database if enabled
-                    if st.session_state.get('auto_save', True):
-                        try:
-                            db.save_life_care_plan(st.session_state.lcp_data)
-                            st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                        except Exception as e:
-                            st.warning(f"Auto-save failed: {str(e)}")
+                    schedule_save()
 
                     st.success("✅ Service updated successfully!")
-                    del st.session_state[f"editing_service_{service_index}"]
-                    st.rerun()
+                    _close_service_editor(table.name, service_index)
+                    st.rerun(scope="app")
 
                 except Exception as e:
                     st.error(f"Error updating service: {str(e)}")
         
         with col2:
-            if st.form_submit_button("❌ Cancel", use_container_width=True):
-                del st.session_state[f"editing_service_{service_index}"]
-                st.rerun()
+            st.form_submit_button("❌ Cancel", use_container_width=True,
+                                  on_click=_close_service_editor, args=(table.name, service_index))
+
+def _close_bulk_inflation():
+    """Close the bulk inflation form. Used as a button callback, so no extra rerun is needed."""
+    st.session_state.show_bulk_inflation = False
 
 def show_unified_view_edit():
     """Show unified view of all tables and services with inline editing capabilities."""
+    lcp = st.session_state.lcp_data
+    current_age = lcp.evaluee.current_age
     st.subheader("🌐 Unified View - All Tables & Services")
     st.markdown("View and edit all your service tables and services from one comprehensive interface.")
     
     # Multi-scenario support
-    has_multiple_scenarios = len(st.session_state.lcp_data.scenarios) > 1
+    has_multiple_scenarios = len(lcp.scenarios) > 1
     
     if has_multiple_scenarios:
         st.markdown("#### 🎭 Scenario Selection")
@@ -1079,7 +1376,7 @@ def show_unified_view_edit():
         selected_scenarios = []
         
         if view_mode == "Current Scenario Only":
-            current_scenario = st.session_state.lcp_data.get_current_scenario()
+            current_scenario = lcp.get_current_scenario()
             st.info(f"**Viewing:** {current_scenario.name if current_scenario else 'Unknown'}")
         elif view_mode == "Selected Scenarios":
             st.markdown("#### 📋 Select Scenarios to View")
@@ -1089,25 +1386,25 @@ def show_unified_view_edit():
             col1, col2, col3 = st.columns([1, 1, 4])
             with col1:
                 if st.button("✅ Select All", key="select_all_scenarios"):
-                    for scenario_key in st.session_state.lcp_data.scenarios.keys():
+                    for scenario_key in lcp.scenarios.keys():
                         st.session_state[f"scenario_select_{scenario_key}"] = True
                     st.rerun()
             with col2:
                 if st.button("❌ Deselect All", key="deselect_all_scenarios"):
-                    for scenario_key in st.session_state.lcp_data.scenarios.keys():
+                    for scenario_key in lcp.scenarios.keys():
                         st.session_state[f"scenario_select_{scenario_key}"] = False
                     st.rerun()
             
             # Create checkboxes for each scenario
             scenario_options = {}
-            col_count = min(3, len(st.session_state.lcp_data.scenarios))  # Max 3 columns
+            col_count = min(3, len(lcp.scenarios))  # Max 3 columns
             cols = st.columns(col_count)
             
-            for idx, (scenario_key, scenario) in enumerate(st.session_state.lcp_data.scenarios.items()):
+            for idx, (scenario_key, scenario) in enumerate(lcp.scenarios.items()):
                 col_idx = idx % col_count
                 with cols[col_idx]:
                     baseline_text = " (Baseline)" if scenario.is_baseline else ""
-                    is_current = scenario_key == st.session_state.lcp_data.active_scenario
+                    is_current = scenario_key == lcp.active_scenario
                     current_text = " 🟢" if is_current else ""
                     
                     # Default to selecting current scenario
@@ -1125,14 +1422,14 @@ def show_unified_view_edit():
                         selected_scenarios.append(scenario_key)
             
             if selected_scenarios:
-                scenario_names = [st.session_state.lcp_data.scenarios[key].name for key in selected_scenarios]
+                scenario_names = [lcp.scenarios[key].name for key in selected_scenarios]
                 st.info(f"**Selected:** {', '.join(scenario_names)} ({len(selected_scenarios)} scenarios)")
             else:
                 st.warning("⚠️ No scenarios selected. Please select at least one scenario to view.")
                 return
         else:  # All Scenarios Combined
-            selected_scenarios = list(st.session_state.lcp_data.scenarios.keys())
-            scenario_count = len(st.session_state.lcp_data.scenarios)
+            selected_scenarios = list(lcp.scenarios.keys())
+            scenario_count = len(lcp.scenarios)
             st.info(f"**Viewing:** All {scenario_count} scenarios combined")
         
         st.markdown("---")
@@ -1145,15 +1442,14 @@ def show_unified_view_edit():
         view_mode = "Current Scenario Only"
     
     # Check if we have any tables
-    if not st.session_state.lcp_data.tables:
+    if not lcp.tables:
         st.info("No service tables created yet. Use the 'Add Table' tab to create your first table.")
         return
     
     # Get all services from current scenario (original functionality preserved)
     all_services = []
-    for table_name, table in st.session_state.lcp_data.tables.items():
+    for table_name, table in lcp.tables.items():
         for i, service in enumerate(table.services):
-            service_years = get_service_years(service)
             all_services.append({
                 'table_name': table_name,
                 'service_name': service.name,
@@ -1162,27 +1458,26 @@ def show_unified_view_edit():
                 'unit_cost': service.unit_cost,
                 'frequency': service.frequency_per_year,
                 'inflation_rate': service.inflation_rate * 100,
-                'years': service_years,
-                'year_range': f"{min(service_years)}-{max(service_years)}" if service_years else "None",
-                'total_years': len(service_years),
-                'service_type': "One-time" if service.is_one_time_cost else ("Distributed" if hasattr(service, 'is_distributed_instances') and service.is_distributed_instances else ("Discrete" if service.occurrence_years else "Recurring"))
+                'search_text': _search_text(service.name, table_name),
+                **_service_year_info(TimingView.from_service(service))
             })
     
     if not all_services:
         st.info("No services found. Add services to your tables using the 'Add/Edit Services' tab.")
         return
+    services_df = pd.DataFrame(all_services)
     
     # Summary statistics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Tables", len(st.session_state.lcp_data.tables))
+        st.metric("Total Tables", len(lcp.tables))
     with col2:
         st.metric("Total Services", len(all_services))
     with col3:
-        total_cost = sum(s['unit_cost'] * s['frequency'] for s in all_services)
+        total_cost = float((services_df['unit_cost'] * services_df['frequency']).sum())
         st.metric("Total Annual Cost", f"${total_cost:,.0f}")
     with col4:
-        avg_inflation = sum(s['inflation_rate'] for s in all_services) / len(all_services)
+        avg_inflation = float(services_df['inflation_rate'].mean())
         st.metric("Avg Inflation", f"{avg_inflation:.1f}%")
     
     st.markdown("---")
@@ -1211,7 +1506,7 @@ def show_unified_view_edit():
         if view_mode == "All Scenarios Combined":
             unique_tables = list(set(s['table_name'] for s in all_services))
         else:
-            unique_tables = list(st.session_state.lcp_data.tables.keys())
+            unique_tables = list(lcp.tables.keys())
         filter_table = st.selectbox("Filter by table:", ["All Tables"] + unique_tables)
     with col3:
         filter_type = st.selectbox("Filter by type:", ["All Types", "Recurring", "One-time", "Discrete", "Distributed"])
@@ -1224,58 +1519,19 @@ def show_unified_view_edit():
     if age_filter_mode == "By Age Range":
         col1, col2 = st.columns(2)
         with col1:
-            age_filter_min = st.number_input("Min age:", min_value=0.0, max_value=120.0, value=st.session_state.lcp_data.evaluee.current_age, step=1.0)
+            age_filter_min = st.number_input("Min age:", min_value=0.0, max_value=120.0, value=current_age, step=1.0)
         with col2:
-            age_filter_max = st.number_input("Max age:", min_value=age_filter_min if age_filter_min else 0.0, max_value=120.0, value=st.session_state.lcp_data.evaluee.current_age + 10, step=1.0)
+            age_filter_max = st.number_input("Max age:", min_value=age_filter_min if age_filter_min else 0.0, max_value=120.0, value=current_age + 10, step=1.0)
         st.info(f"💡 Showing services active between ages {age_filter_min:.0f} and {age_filter_max:.0f}")
     elif age_filter_mode == "Active at Age":
-        age_filter_specific = st.number_input("Show services active at age:", min_value=0.0, max_value=120.0, value=st.session_state.lcp_data.evaluee.current_age, step=1.0)
+        age_filter_specific = st.number_input("Show services active at age:", min_value=0.0, max_value=120.0, value=current_age, step=1.0)
         st.info(f"💡 Showing services active at age {age_filter_specific:.0f}")
     
     # Apply filters
-    filtered_services = all_services
-    if search_term:
-        filtered_services = [s for s in filtered_services if 
-                           search_term.lower() in s['service_name'].lower() or 
-                           search_term.lower() in s['table_name'].lower() or
-                           (view_mode == "All Scenarios Combined" and search_term.lower() in s['scenario_name'].lower())]
-    if filter_table != "All Tables":
-        filtered_services = [s for s in filtered_services if s['table_name'] == filter_table]
-    if filter_type != "All Types":
-        filtered_services = [s for s in filtered_services if s['service_type'] == filter_type]
-    if filter_scenario and filter_scenario != "All Scenarios":
-        filtered_services = [s for s in filtered_services if s['scenario_name'] == filter_scenario]
-    
-    # Apply age filtering
-    if age_filter_mode != "All Ages":
-        age_filtered_services = []
-        base_year = st.session_state.lcp_data.settings.base_year
-        current_age = st.session_state.lcp_data.evaluee.current_age
-        
-        for service_data in filtered_services:
-            service_years = service_data['years']
-            if not service_years:
-                continue
-                
-            # Convert years to ages
-            service_ages = [calculate_age_for_year(base_year, current_age, year) for year in service_years]
-            
-            include_service = False
-            if age_filter_mode == "By Age Range":
-                # Check if service is active during any part of the age range
-                min_service_age = min(service_ages)
-                max_service_age = max(service_ages)
-                if (min_service_age <= age_filter_max and max_service_age >= age_filter_min):
-                    include_service = True
-            elif age_filter_mode == "Active at Age":
-                # Check if service is active at the specific age
-                if age_filter_specific >= min(service_ages) and age_filter_specific <= max(service_ages):
-                    include_service = True
-            
-            if include_service:
-                age_filtered_services.append(service_data)
-        
-        filtered_services = age_filtered_services
+    filtered_services = _filter_services(
+        all_services, services_df, search_term, filter_table, filter_type, filter_scenario,
+        age_filter_mode, age_filter_min, age_filter_max, age_filter_specific
+    )
     
     st.markdown(f"### Found {len(filtered_services)} services")
     
@@ -1306,40 +1562,42 @@ def show_unified_view_edit():
             with col2:
                 apply_to = st.selectbox("Apply to:", ["All Services", "Selected Table Only"])
             with col3:
-                target_table = st.selectbox("Target table:", list(st.session_state.lcp_data.tables.keys())) if apply_to == "Selected Table Only" else None
+                target_table = st.selectbox("Target table:", list(lcp.tables.keys())) if apply_to == "Selected Table Only" else None
             
             col1, col2 = st.columns(2)
             with col1:
                 if st.form_submit_button("✅ Update Inflation", use_container_width=True):
-                    update_count = 0
-                    for service_data in filtered_services:
-                        if apply_to == "All Services" or service_data['table_name'] == target_table:
-                            service_data['service_obj'].inflation_rate = new_inflation / 100
-                            update_count += 1
+                    target_rate = new_inflation / 100
+                    changed = [
+                        service_data['service_obj'] for service_data in filtered_services
+                        if (apply_to == "All Services" or service_data['table_name'] == target_table)
+                        and service_data['service_obj'].inflation_rate != target_rate
+                    ]
                     
-                    # Auto-save if enabled
-                    if st.session_state.get('auto_save', True):
-                        try:
-                            db.save_life_care_plan(st.session_state.lcp_data)
-                            st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                        except Exception as e:
-                            st.warning(f"Auto-save failed: {str(e)}")
-                    
-                    st.success(f"✅ Updated inflation rate for {update_count} services to {new_inflation}%")
-                    st.session_state.show_bulk_inflation = False
-                    st.rerun()
+                    # Skip the save and the rerun when every service already has this rate
+                    if not changed:
+                        st.info("No changes - the selected services already use this inflation rate.")
+                    else:
+                        for service_obj in changed:
+                            service_obj.inflation_rate = target_rate
+                        
+                        # Auto-save if enabled
+                        schedule_save()
+                        
+                        st.success(f"✅ Updated inflation rate for {len(changed)} services to {new_inflation}%")
+                        st.session_state.show_bulk_inflation = False
+                        st.rerun()
             
             with col2:
-                if st.form_submit_button("❌ Cancel", use_container_width=True):
-                    st.session_state.show_bulk_inflation = False
-                    st.rerun()
+                st.form_submit_button("❌ Cancel", use_container_width=True, on_click=_close_bulk_inflation)
     
     st.markdown("---")
     
     # Detailed service list with inline editing
     st.markdown("#### 📋 Service Details")
     
-    # Group services by scenario and table for better organization
+    # Group services by scenario and table for better organization. As in the overview,
+    # toggles stand in for expanders so groups that are switched off build no table.
     if view_mode == "All Scenarios Combined":
         services_by_scenario_table = {}
         for service in filtered_services:
@@ -1348,9 +1606,14 @@ def show_unified_view_edit():
                 services_by_scenario_table[key] = []
             services_by_scenario_table[key].append(service)
         
-        for scenario_table_key, table_services in services_by_scenario_table.items():
-            with st.expander(f"🎭 {scenario_table_key} ({len(table_services)} services)", expanded=True):
-                _display_service_list(table_services, view_mode)
+        for position, (scenario_table_key, table_services) in enumerate(services_by_scenario_table.items()):
+            first = table_services[0]
+            editor_key = f"editor_single_{first.get('scenario_key', 'current')}_{first['table_name']}"
+            with st.container(border=True):
+                if not st.toggle(f"🎭 {scenario_table_key} ({len(table_services)} services)",
+                                 value=position < UNIFIED_EXPANDED_GROUPS, key=f"expanded_{editor_key}"):
+                    continue
+                _display_service_list(table_services, editor_key, show_scenario=True)
     else:
         services_by_table = {}
         for service in filtered_services:
@@ -1359,118 +1622,167 @@ def show_unified_view_edit():
                 services_by_table[table_name] = []
             services_by_table[table_name].append(service)
         
-        for table_name, table_services in services_by_table.items():
-            with st.expander(f"📋 {table_name} ({len(table_services)} services)", expanded=True):
-                _display_service_list(table_services, view_mode)
-
-def _display_service_list(table_services, view_mode):
-    """Helper function to display a list of services with editing capabilities."""
-    for service_data in table_services:
+        for position, (table_name, table_services) in enumerate(services_by_table.items()):
+            editor_key = f"editor_{table_name}"
+            with st.container(border=True):
+                if not st.toggle(f"📋 {table_name} ({len(table_services)} services)",
+                                 value=position < UNIFIED_EXPANDED_GROUPS, key=f"expanded_{editor_key}"):
+                    continue
+                _display_service_list(table_services, editor_key)
+
+@functools.lru_cache(maxsize=4096)
+def _search_text(*names: str) -> str:
+    """Case-folded names a unified-view row can be found by, one per line."""
+    return "\n".join(names).casefold()
+
+def _filter_services(all_services, services_df, search_term, filter_table, filter_type, filter_scenario,
+                     age_filter_mode, age_filter_min, age_filter_max, age_filter_specific):
+    """Apply the unified-view filters as boolean masks over services_df and return the matching rows."""
+    mask = pd.Series(True, index=services_df.index)
+    if search_term:
+        mask &= services_df['search_text'].str.contains(search_term.casefold(), regex=False)
+    if filter_table != "All Tables":
+        mask &= services_df['table_name'] == filter_table
+    if filter_type != "All Types":
+        mask &= services_df['service_type'] == filter_type
+    if filter_scenario and filter_scenario != "All Scenarios":
+        mask &= services_df['scenario_name'] == filter_scenario
+    
+    if age_filter_mode != "All Ages":
+        lcp = st.session_state.lcp_data
+        base_year = lcp.settings.base_year
+        current_age = lcp.evaluee.current_age
+        # Age rises with the year, so the first and last years bound each service's ages.
+        # Services without any years get NaN bounds, which never match.
+        min_service_age = current_age + (services_df['first_year'].astype(float) - base_year)
+        max_service_age = current_age + (services_df['last_year'].astype(float) - base_year)
+        if age_filter_mode == "By Age Range":
+            # Check if service is active during any part of the age range
+            mask &= (min_service_age <= age_filter_max) & (max_service_age >= age_filter_min)
+        elif age_filter_mode == "Active at Age":
+            # Check if service is active at the specific age
+            mask &= (min_service_age <= age_filter_specific) & (max_service_age >= age_filter_specific)
+    
+    return [all_services[i] for i in services_df.index[mask]]
+
+def _years_label(service_data, base_year, current_age) -> str:
+    """Year range of a unified-view row with the evaluee's ages in those years."""
+    if not service_data['intervals']:
+        return service_data['year_range']
+    if service_data['total_years'] <= 3:
+        ages = [calculate_age_for_year(base_year, current_age, year)
+                for year in expand_years(service_data['intervals'])]
+        age_str = ', '.join([f"Age {age:.1f}" for age in ages])
+        return f"{service_data['year_range']} ({age_str})"
+    start_age = calculate_age_for_year(base_year, current_age, service_data['first_year'])
+    end_age = calculate_age_for_year(base_year, current_age, service_data['last_year'])
+    return f"{service_data['year_range']} (Age {start_age:.1f} to {end_age:.1f})"
+
+# Columns of the unified-view service table that can be edited inline
+_EDITABLE_SERVICE_COLUMNS = ["Unit Cost", "Freq/yr", "Inflation %"]
+
+@st.fragment
+def _display_service_list(table_services, editor_key, show_scenario=False):
+    """Helper function to display a group of services as one inline-editable table.
+    
+    Edits are written straight to each row's service_obj, which is the service in its
+    own scenario, so no scenario switch is needed. Runs as a fragment so a cell edit
+    only reruns this table until it is applied.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
+    lcp = st.session_state.lcp_data
+    base_year = lcp.settings.base_year
+    current_age = lcp.evaluee.current_age
+    
+    df_rows = pd.DataFrame([{
+        'Service': s['service_name'],
+        'Unit Cost': float(s['unit_cost']),
+        'Freq/yr': float(s['frequency']),
+        'Inflation %': float(s['inflation_rate']),
+        'Annual': s['unit_cost'] * s['frequency'],
+        'Years': _years_label(s, base_year, current_age),
+        'Total Years': s['total_years'],
+        'Type': s['service_type'],
+    } for s in table_services])
+    if show_scenario:
+        # Drop the "(Baseline)" suffix for display
+        df_rows['Scenario'] = [s['scenario_name'].split(' (')[0] for s in table_services]
+    
+    edited = st.data_editor(
+        df_rows,
+        column_config={
+            'Unit Cost': st.column_config.NumberColumn("Unit Cost ($)", min_value=0.0, format="$%.2f"),
+            'Freq/yr': st.column_config.NumberColumn("Freq/yr", min_value=0.1, format="%.1f"),
+            'Inflation %': st.column_config.NumberColumn("Inflation %", min_value=0.0, max_value=20.0, format="%.1f%%"),
+            'Annual': st.column_config.NumberColumn("Annual", format="$%.0f"),
+        },
+        disabled=[column for column in df_rows.columns if column not in _EDITABLE_SERVICE_COLUMNS],
+        hide_index=True,
+        num_rows="fixed",
+        use_container_width=True,
+        key=editor_key,
+    )
+    
+    changed = 0
+    for row, service_data in zip(edited.itertuples(index=False), table_services):
         service = service_data['service_obj']
-        service_index = service_data['service_index']
-        table_name = service_data['table_name']
-        
-        # Create columns for service display
-        col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
-        
-        with col1:
-            st.markdown(f"**{service.name}**")
-            # Show age information for service years
-            if service_data['years']:
-                if len(service_data['years']) <= 3:
-                    ages = [calculate_age_for_year(st.session_state.lcp_data.settings.base_year, 
-                                                 st.session_state.lcp_data.evaluee.current_age, year) 
-                           for year in service_data['years']]
-                    age_str = ', '.join([f"Age {age:.1f}" for age in ages])
-                    st.caption(f"📅 {service_data['year_range']} ({age_str})")
-                else:
-                    start_age = calculate_age_for_year(st.session_state.lcp_data.settings.base_year, 
-                                                     st.session_state.lcp_data.evaluee.current_age, 
-                                                     min(service_data['years']))
-                    end_age = calculate_age_for_year(st.session_state.lcp_data.settings.base_year, 
-                                                   st.session_state.lcp_data.evaluee.current_age, 
-                                                   max(service_data['years']))
-                    st.caption(f"📅 {service_data['year_range']} (Age {start_age:.1f} to {end_age:.1f})")
-        
-        with col2:
-            st.write(f"**${service.unit_cost:,.2f}**")
-            st.caption(f"{service.frequency_per_year:.1f}/year")
-        
-        with col3:
-            st.write(f"**{service.inflation_rate*100:.1f}%**")
-            st.caption(f"{service_data['service_type']}")
+        new_cost, new_freq, new_inflation = row[1], row[2], row[3]
+        # Cleared cells keep the stored value
+        if pd.isna(new_cost) or pd.isna(new_freq) or pd.isna(new_inflation):
+            continue
+        if (new_cost == service_data['unit_cost'] and new_freq == service_data['frequency']
+                and new_inflation == service_data['inflation_rate']):
+            continue
+        service.unit_cost = new_cost
+        service.frequency_per_year = new_freq
+        service.inflation_rate = new_inflation / 100
+        changed += 1
+    
+    if changed:
+        # The editor keeps its edits by row position, so drop them once applied
+        # rather than letting them land on other services when the filters change
+        del st.session_state[editor_key]
         
-        with col4:
-            annual_cost = service.unit_cost * service.frequency_per_year
-            st.write(f"**${annual_cost:,.0f}**/year")
-            st.caption(f"{service_data['total_years']} years")
-        
-        with col5:
-            # Create unique key based on view mode to avoid duplicates
-            view_prefix = "multi" if view_mode == "All Scenarios Combined" else "single"
-            scenario_id = service_data.get('scenario_key', 'current') if view_mode == "All Scenarios Combined" else 'current'
-            edit_key = f"edit_unified_{view_prefix}_{scenario_id}_{table_name}_{service_index}"
-            edit_state_key = f"editing_unified_{view_prefix}_{scenario_id}_{table_name}_{service_index}"
-            
-            if st.button("✏️", key=edit_key, help="Quick edit"):
-                st.session_state[edit_state_key] = True
-                st.rerun()
-        
-        # Simplified quick edit form with basic cost/frequency editing only
-        if st.session_state.get(edit_state_key, False):
-            with st.form(f"quick_edit_{view_prefix}_{scenario_id}_{table_name}_{service_index}"):
-                st.markdown(f"**Quick Edit: {service.name}**")
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    new_cost = st.number_input("Unit Cost ($):", value=float(service.unit_cost), min_value=0.0)
-                with col2:
-                    new_freq = st.number_input("Frequency/Year:", value=float(service.frequency_per_year), min_value=0.1)
-                with col3:
-                    new_inflation = st.number_input("Inflation (%):", value=float(service.inflation_rate * 100), min_value=0.0, max_value=20.0)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.form_submit_button("💾 Save", use_container_width=True):
-                        # For multi-scenario view, we may need to switch scenarios
-                        if view_mode == "All Scenarios Combined" and scenario_id != 'current':
-                            # Switch to the correct scenario for editing
-                            original_scenario = st.session_state.lcp_data.active_scenario
-                            st.session_state.lcp_data.set_active_scenario(scenario_id)
-                            
-                            # Update the service in the correct scenario
-                            target_table = st.session_state.lcp_data.tables[table_name]
-                            target_service = target_table.services[service_index]
-                            target_service.unit_cost = new_cost
-                            target_service.frequency_per_year = new_freq
-                            target_service.inflation_rate = new_inflation / 100
-                            
-                            # Switch back to original scenario
-                            st.session_state.lcp_data.set_active_scenario(original_scenario)
-                        else:
-                            # Update cost and frequency information in current scenario
-                            service.unit_cost = new_cost
-                            service.frequency_per_year = new_freq
-                            service.inflation_rate = new_inflation / 100
-                        
-                        # Auto-save if enabled
-                        if st.session_state.get('auto_save', True):
-                            try:
-                                db.save_life_care_plan(st.session_state.lcp_data)
-                                st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                            except Exception as e:
-                                st.warning(f"Auto-save failed: {str(e)}")
-                        
-                        st.success("✅ Service updated!")
-                        del st.session_state[edit_state_key]
-                        st.rerun()
-                
-                with col2:
-                    if st.form_submit_button("❌ Cancel", use_container_width=True):
-                        del st.session_state[edit_state_key]
-                        st.rerun()
-        
-        st.markdown("---")
+        # Auto-save if enabled, then refresh the metrics above the table
+        schedule_save()
+        st.rerun(scope="app")
+
+def _overlapping_pairs(service_intervals) -> List[Tuple[int, int]]:
+    """Find the pairs (i, j), i < j, of services whose intervals share a year.
+    
+    Services are sorted by their first year once; each one is then compared with the
+    services after it until one starts past its last year, since no later service can
+    overlap it. Two contiguous ranges that get that far overlap outright; _any_overlap
+    only has to check the gaps of the other services.
+    """
+    order = sorted(
+        (intervals[0][0], intervals[-1][1], i)
+        for i, intervals in enumerate(service_intervals) if intervals
+    )
+    pairs = []
+    for k, (_, hi, i) in enumerate(order):
+        contiguous = len(service_intervals[i]) == 1
+        for m in range(k + 1, len(order)):
+            lo_j, _, j = order[m]
+            if lo_j > hi:
+                break
+            if ((contiguous and len(service_intervals[j]) == 1)
+                    or _any_overlap(service_intervals[i], service_intervals[j])):
+                pairs.append((min(i, j), max(i, j)))
+    return sorted(pairs)
+
+@functools.lru_cache(maxsize=64)
+def _table_overlaps(timings: Tuple[TimingView, ...]) -> Tuple[Tuple[int, int, List[int]], ...]:
+    """Get (i, j, overlap years) for every overlapping pair of a table's service timings.
+    
+    Keyed on the timings, so reruns that leave a table's timing unchanged reuse the result.
+    """
+    service_intervals = [timing.intervals() for timing in timings]
+    return tuple(
+        (i, j, expand_years(_overlap_intervals(service_intervals[i], service_intervals[j])))
+        for i, j in _overlapping_pairs(service_intervals)
+    )
 
 def show_all_overlaps():
     """Detect and display all service overlaps across all tables."""
@@ -1480,20 +1792,14 @@ def show_all_overlaps():
     
     # Check each table for internal overlaps
     for table_name, table in st.session_state.lcp_data.tables.items():
-        for i, service1 in enumerate(table.services):
-            years1 = set(get_service_years(service1))
-            
-            for j, service2 in enumerate(table.services[i+1:], i+1):
-                years2 = set(get_service_years(service2))
-                overlap_years = years1.intersection(years2)
-                
-                if overlap_years:
-                    overlaps_found.append({
-                        'table': table_name,
-                        'service1': service1.name,
-                        'service2': service2.name,
-                        'overlap_years': sorted(overlap_years)
-                    })
+        timings = tuple(TimingView.from_service(service) for service in table.services)
+        for i, j, overlap_years in _table_overlaps(timings):
+            overlaps_found.append({
+                'table': table_name,
+                'service1': table.services[i].name,
+                'service2': table.services[j].name,
+                'overlap_years': overlap_years
+            })
     
     if overlaps_found:
         st.warning(f"⚠️ Found {len(overlaps_found)} service overlaps:")
@@ -1507,38 +1813,56 @@ def show_all_overlaps():
     else:
         st.success("✅ No service overlaps detected!")
 
+# Column headers of the exported service list
+_EXPORT_COLUMNS = [
+    'Table', 'Service', 'Type', 'Unit Cost', 'Frequency/Year',
+    'Inflation Rate (%)', 'Year Range', 'Total Years', 'Annual Cost'
+]
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_export_csv(rows) -> str:
+    """Write the exported fields of each service straight to CSV text."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(_EXPORT_COLUMNS)
+    writer.writerows(
+        (table_name, service_name, service_type, float(unit_cost), float(frequency),
+         float(inflation_rate), year_range, total_years, float(unit_cost) * float(frequency))
+        for (table_name, service_name, service_type, unit_cost, frequency,
+             inflation_rate, year_range, total_years) in rows
+    )
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_export_df(rows) -> pd.DataFrame:
+    """Build the export preview DataFrame from the exported fields of each service."""
+    # Transpose the rows so pandas ingests whole columns
+    df = pd.DataFrame(dict(zip(_EXPORT_COLUMNS, zip(*rows) if rows else ((),) * 8)))
+    df['Annual Cost'] = df['Unit Cost'] * df['Frequency/Year']
+    return df
+
 def show_export_service_list(services):
     """Show export options for the service list."""
     st.markdown("#### 💾 Export Service List")
     
-    # Create DataFrame for export
-    export_data = []
-    for service in services:
-        export_data.append({
-            'Table': service['table_name'],
-            'Service': service['service_name'],
-            'Type': service['service_type'],
-            'Unit Cost': service['unit_cost'],
-            'Frequency/Year': service['frequency'],
-            'Inflation Rate (%)': service['inflation_rate'],
-            'Year Range': service['year_range'],
-            'Total Years': service['total_years'],
-            'Annual Cost': service['unit_cost'] * service['frequency']
-        })
-    
-    df = pd.DataFrame(export_data)
+    # Exported fields of each service; the CSV and preview are cached on them
+    rows = tuple(
+        (service['table_name'], service['service_name'], service['service_type'], service['unit_cost'],
+         service['frequency'], service['inflation_rate'], service['year_range'], service['total_years'])
+        for service in services
+    )
     
     # Display as CSV
-    csv = df.to_csv(index=False)
     st.download_button(
         label="📥 Download as CSV",
-        data=csv,
+        data=_build_export_csv(rows),
         file_name=f"service_list_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
         mime="text/csv"
     )
     
-    # Show preview
-    st.dataframe(df, use_container_width=True)
+    # Show preview, collapsed so the panel leads with the download
+    with st.expander("📋 Preview CSV", expanded=False):
+        st.dataframe(_build_export_df(rows), use_container_width=True)
 
 def show_multi_scenario_unified_view(selected_scenario_keys=None):
     """Show unified view across selected scenarios with editing capabilities.
@@ -1546,21 +1870,24 @@ def show_multi_scenario_unified_view(selected_scenario_keys=None):
     Args:
         selected_scenario_keys: List of scenario keys to include. If None, includes all scenarios.
     """
+    lcp = st.session_state.lcp_data
+    current_age = lcp.evaluee.current_age
+    
     # Default to all scenarios if none specified
     if selected_scenario_keys is None:
-        selected_scenario_keys = list(st.session_state.lcp_data.scenarios.keys())
+        selected_scenario_keys = list(lcp.scenarios.keys())
     
     st.markdown("### 🎭 Multi-Scenario Unified View")
     
     # Show which scenarios are being viewed
-    if len(selected_scenario_keys) == len(st.session_state.lcp_data.scenarios):
+    if len(selected_scenario_keys) == len(lcp.scenarios):
         st.markdown("View and edit services across **all scenarios**. **Note:** Editing services will modify them in their respective scenarios.")
     else:
-        scenario_names = [st.session_state.lcp_data.scenarios[key].name for key in selected_scenario_keys]
+        scenario_names = [lcp.scenarios[key].name for key in selected_scenario_keys]
         st.markdown(f"View and edit services from **{len(selected_scenario_keys)} selected scenarios**: {', '.join(scenario_names)}. **Note:** Editing services will modify them in their respective scenarios.")
     
     # Check if selected scenarios have tables
-    has_tables = any(st.session_state.lcp_data.scenarios[key].tables for key in selected_scenario_keys if key in st.session_state.lcp_data.scenarios)
+    has_tables = any(lcp.scenarios[key].tables for key in selected_scenario_keys if key in lcp.scenarios)
     if not has_tables:
         st.info("No service tables found in the selected scenarios. Create tables and services first.")
         return
@@ -1568,13 +1895,12 @@ def show_multi_scenario_unified_view(selected_scenario_keys=None):
     # Collect services from selected scenarios only
     all_services = []
     for scenario_key in selected_scenario_keys:
-        if scenario_key not in st.session_state.lcp_data.scenarios:
+        if scenario_key not in lcp.scenarios:
             continue  # Skip if scenario doesn't exist
             
-        scenario = st.session_state.lcp_data.scenarios[scenario_key]
+        scenario = lcp.scenarios[scenario_key]
         for table_name, table in scenario.tables.items():
             for i, service in enumerate(table.services):
-                service_years = get_service_years(service)
                 baseline_text = " (Baseline)" if scenario.is_baseline else ""
                 all_services.append({
                     'scenario_name': f"{scenario.name}{baseline_text}",
@@ -1586,10 +1912,8 @@ def show_multi_scenario_unified_view(selected_scenario_keys=None):
                     'unit_cost': service.unit_cost,
                     'frequency': service.frequency_per_year,
                     'inflation_rate': service.inflation_rate * 100,
-                    'years': service_years,
-                    'year_range': f"{min(service_years)}-{max(service_years)}" if service_years else "None",
-                    'total_years': len(service_years),
-                    'service_type': "One-time" if service.is_one_time_cost else ("Distributed" if hasattr(service, 'is_distributed_instances') and service.is_distributed_instances else ("Discrete" if service.occurrence_years else "Recurring"))
+                    'search_text': _search_text(service.name, table_name, f"{scenario.name}{baseline_text}"),
+                    **_service_year_info(TimingView.from_service(service))
                 })
     
     if not all_services:
@@ -1597,16 +1921,17 @@ def show_multi_scenario_unified_view(selected_scenario_keys=None):
         return
     
     # Summary statistics
+    services_df = pd.DataFrame(all_services)
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Selected Scenarios", len(selected_scenario_keys))
     with col2:
-        table_count = len(set(s['table_name'] for s in all_services))
+        table_count = services_df['table_name'].nunique()
         st.metric("Unique Tables", table_count)
     with col3:
         st.metric("Total Services", len(all_services))
     with col4:
-        total_cost = sum(s['unit_cost'] * s['frequency'] for s in all_services)
+        total_cost = float((services_df['unit_cost'] * services_df['frequency']).sum())
         st.metric("Total Annual Cost", f"${total_cost:,.0f}")
     
     st.markdown("---")
@@ -1636,60 +1961,21 @@ def show_multi_scenario_unified_view(selected_scenario_keys=None):
     if age_filter_mode == "By Age Range":
         col1, col2 = st.columns(2)
         with col1:
-            age_filter_min = st.number_input("Min age:", min_value=0.0, max_value=120.0, value=st.session_state.lcp_data.evaluee.current_age, step=1.0, key="multi_age_min")
+            age_filter_min = st.number_input("Min age:", min_value=0.0, max_value=120.0, value=current_age, step=1.0, key="multi_age_min")
         with col2:
-            age_filter_max = st.number_input("Max age:", min_value=age_filter_min if age_filter_min else 0.0, max_value=120.0, value=st.session_state.lcp_data.evaluee.current_age + 10, step=1.0, key="multi_age_max")
+            age_filter_max = st.number_input("Max age:", min_value=age_filter_min if age_filter_min else 0.0, max_value=120.0, value=current_age + 10, step=1.0, key="multi_age_max")
         st.info(f"💡 Showing services active between ages {age_filter_min:.0f} and {age_filter_max:.0f} across all scenarios")
     elif age_filter_mode == "Active at Age":
-        age_filter_specific = st.number_input("Show services active at age:", min_value=0.0, max_value=120.0, value=st.session_state.lcp_data.evaluee.current_age, step=1.0, key="multi_age_specific")
+        age_filter_specific = st.number_input("Show services active at age:", min_value=0.0, max_value=120.0, value=current_age, step=1.0, key="multi_age_specific")
         st.info(f"💡 Showing services active at age {age_filter_specific:.0f} across all scenarios")
     
     # Apply filters
-    filtered_services = all_services
-    if search_term:
-        filtered_services = [s for s in filtered_services if 
-                           search_term.lower() in s['service_name'].lower() or 
-                           search_term.lower() in s['table_name'].lower() or
-                           search_term.lower() in s['scenario_name'].lower()]
-    if filter_scenario != "All Scenarios":
-        filtered_services = [s for s in filtered_services if s['scenario_name'] == filter_scenario]
-    if filter_table != "All Tables":
-        filtered_services = [s for s in filtered_services if s['table_name'] == filter_table]
-    if filter_type != "All Types":
-        filtered_services = [s for s in filtered_services if s['service_type'] == filter_type]
-    
-    # Apply age filtering for multi-scenario view
-    if age_filter_mode != "All Ages":
-        age_filtered_services = []
-        base_year = st.session_state.lcp_data.settings.base_year
-        current_age = st.session_state.lcp_data.evaluee.current_age
-        
-        for service_data in filtered_services:
-            service_years = service_data['years']
-            if not service_years:
-                continue
-                
-            # Convert years to ages
-            service_ages = [calculate_age_for_year(base_year, current_age, year) for year in service_years]
-            
-            include_service = False
-            if age_filter_mode == "By Age Range":
-                # Check if service is active during any part of the age range
-                min_service_age = min(service_ages)
-                max_service_age = max(service_ages)
-                if (min_service_age <= age_filter_max and max_service_age >= age_filter_min):
-                    include_service = True
-            elif age_filter_mode == "Active at Age":
-                # Check if service is active at the specific age
-                if age_filter_specific >= min(service_ages) and age_filter_specific <= max(service_ages):
-                    include_service = True
-            
-            if include_service:
-                age_filtered_services.append(service_data)
-        
-        filtered_services = age_filtered_services
+    filtered_services = _filter_services(
+        all_services, services_df, search_term, filter_table, filter_type, filter_scenario,
+        age_filter_mode, age_filter_min, age_filter_max, age_filter_specific
+    )
     
-    scenario_text = "selected scenarios" if len(selected_scenario_keys) < len(st.session_state.lcp_data.scenarios) else "all scenarios"
+    scenario_text = "selected scenarios" if len(selected_scenario_keys) < len(lcp.scenarios) else "all scenarios"
     st.markdown(f"### Found {len(filtered_services)} services across {scenario_text}")
     
     if not filtered_services:
@@ -1705,111 +1991,12 @@ def show_multi_scenario_unified_view(selected_scenario_keys=None):
         services_by_scenario_table[key].append(service)
     
     # Display services grouped by scenario/table
-    for scenario_table_key, table_services in services_by_scenario_table.items():
-        with st.expander(f"🎭 {scenario_table_key} ({len(table_services)} services)", expanded=True):
-            
-            for service_data in table_services:
-                service = service_data['service_obj']
-                service_index = service_data['service_index']
-                table_name = service_data['table_name']
-                scenario_key = service_data['scenario_key']
-                
-                # Create unique key for multi-scenario editing
-                edit_key = f"multi_scenario_{scenario_key}_{table_name}_{service_index}"
-                
-                # Create columns for service display
-                col1, col2, col3, col4, col5, col6 = st.columns([3, 1.5, 1.5, 1.5, 1, 1])
-                
-                with col1:
-                    st.markdown(f"**{service.name}**")
-                    # Show age information for service years
-                    if service_data['years']:
-                        if len(service_data['years']) <= 3:
-                            ages = [calculate_age_for_year(st.session_state.lcp_data.settings.base_year, 
-                                                         st.session_state.lcp_data.evaluee.current_age, year) 
-                                   for year in service_data['years']]
-                            age_str = ', '.join([f"Age {age:.1f}" for age in ages])
-                            st.caption(f"📅 {service_data['year_range']} ({age_str})")
-                        else:
-                            start_age = calculate_age_for_year(st.session_state.lcp_data.settings.base_year, 
-                                                             st.session_state.lcp_data.evaluee.current_age, 
-                                                             min(service_data['years']))
-                            end_age = calculate_age_for_year(st.session_state.lcp_data.settings.base_year, 
-                                                           st.session_state.lcp_data.evaluee.current_age, 
-                                                           max(service_data['years']))
-                            st.caption(f"📅 {service_data['year_range']} (Age {start_age:.1f} to {end_age:.1f})")
-                
-                with col2:
-                    st.write(f"**${service.unit_cost:,.2f}**")
-                    st.caption(f"{service.frequency_per_year:.1f}/year")
-                
-                with col3:
-                    st.write(f"**{service.inflation_rate*100:.1f}%**")
-                    st.caption(f"{service_data['service_type']}")
-                
-                with col4:
-                    annual_cost = service.unit_cost * service.frequency_per_year
-                    st.write(f"**${annual_cost:,.0f}**/year")
-                    st.caption(f"{service_data['total_years']} years")
-                
-                with col5:
-                    scenario_parts = service_data['scenario_name'].split(' (')[0]  # Remove "(Baseline)" for display
-                    st.caption(f"**Scenario:**")
-                    st.caption(f"{scenario_parts}")
-                
-                with col6:
-                    if st.button("✏️", key=f"edit_{edit_key}", help="Edit service"):
-                        st.session_state[f"editing_{edit_key}"] = True
-                        st.rerun()
-                
-                # Quick edit form for cross-scenario editing
-                if st.session_state.get(f"editing_{edit_key}", False):
-                    with st.form(f"edit_form_{edit_key}"):
-                        st.markdown(f"**Editing: {service.name}** (in {service_data['scenario_name']})")
-                        st.warning("⚠️ **Multi-Scenario Edit**: Changes will be applied to this service in its original scenario.")
-                        
-                        # Cost and frequency section
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            new_cost = st.number_input("Unit Cost ($):", value=float(service.unit_cost), min_value=0.0, key=f"cost_{edit_key}")
-                        with col2:
-                            new_freq = st.number_input("Frequency/Year:", value=float(service.frequency_per_year), min_value=0.1, key=f"freq_{edit_key}")
-                        with col3:
-                            new_inflation = st.number_input("Inflation (%):", value=float(service.inflation_rate * 100), min_value=0.0, max_value=20.0, key=f"infl_{edit_key}")
-                        
-                        # Save/Cancel buttons
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            if st.form_submit_button("💾 Save Changes", use_container_width=True):
-                                # Switch to the correct scenario for editing
-                                original_scenario = st.session_state.lcp_data.active_scenario
-                                st.session_state.lcp_data.set_active_scenario(scenario_key)
-                                
-                                # Update the service
-                                target_table = st.session_state.lcp_data.tables[table_name]
-                                target_service = target_table.services[service_index]
-                                target_service.unit_cost = new_cost
-                                target_service.frequency_per_year = new_freq
-                                target_service.inflation_rate = new_inflation / 100
-                                
-                                # Switch back to original scenario
-                                st.session_state.lcp_data.set_active_scenario(original_scenario)
-                                
-                                # Auto-save if enabled
-                                if st.session_state.get('auto_save', True):
-                                    try:
-                                        db.save_life_care_plan(st.session_state.lcp_data)
-                                        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                                    except Exception as e:
-                                        st.warning(f"Auto-save failed: {str(e)}")
-                                
-                                st.success(f"✅ Updated {service.name} in {service_data['scenario_name']}!")
-                                del st.session_state[f"editing_{edit_key}"]
-                                st.rerun()
-                        
-                        with col2:
-                            if st.form_submit_button("❌ Cancel", use_container_width=True):
-                                del st.session_state[f"editing_{edit_key}"]
-                                st.rerun()
-                
-                st.markdown("---")
+    for position, (scenario_table_key, table_services) in enumerate(services_by_scenario_table.items()):
+        first = table_services[0]
+        editor_key = f"editor_multi_{first['scenario_key']}_{first['table_name']}"
+        with st.container(border=True):
+            if not st.toggle(f"🎭 {scenario_table_key} ({len(table_services)} services)",
+                             value=position < UNIFIED_EXPANDED_GROUPS, key=f"expanded_{editor_key}"):
+                continue
+            st.caption("⚠️ **Multi-Scenario Edit**: Changes are applied to each service in its original scenario.")
+            _display_service_list(table_services, editor_key, show_scenario=True)
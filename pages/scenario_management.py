@@ -4,9 +4,8 @@ Scenario Management Page for Streamlit Life Care Plan Application
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from src.models import Scenario
-from src.database import db
+from src.models import ProjectionSettings, Scenario
+from src.autosave import flush_pending_saves, schedule_save
 
 def show_scenario_management_page():
     """Display the scenario management page."""
@@ -31,10 +30,10 @@ def show_scenario_management_page():
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        scenario_names = list(st.session_state.lcp_data.scenarios.keys())
-        current_index = 0
-        if st.session_state.lcp_data.active_scenario in scenario_names:
-            current_index = scenario_names.index(st.session_state.lcp_data.active_scenario)
+        scenarios = st.session_state.lcp_data.scenarios
+        active_scenario = st.session_state.lcp_data.active_scenario
+        scenario_names = list(scenarios)
+        current_index = scenario_names.index(active_scenario) if active_scenario in scenarios else 0
         
         selected_scenario = st.selectbox(
             "Active Scenario",
@@ -43,7 +42,7 @@ def show_scenario_management_page():
             help="Select the scenario to view and edit"
         )
         
-        if selected_scenario != st.session_state.lcp_data.active_scenario:
+        if selected_scenario != active_scenario:
             st.session_state.lcp_data.set_active_scenario(selected_scenario)
             st.success(f"Switched to scenario: {selected_scenario}")
             st.rerun()
@@ -87,8 +86,23 @@ def show_scenario_management_page():
     with tab4:
         show_scenario_settings()
 
+def _open_scenario_form(form_flag: str, scenario_name: str):
+    """Open the copy or rename form for a scenario. Used as a button callback, so no extra rerun is needed."""
+    st.session_state[form_flag] = scenario_name
+
+def _close_scenario_form(form_flag: str):
+    """Close the copy or rename form. Used as a button callback, so no extra rerun is needed."""
+    st.session_state.pop(form_flag, None)
+
+@st.fragment
 def show_scenarios_overview():
-    """Show overview of all scenarios."""
+    """Show overview of all scenarios.
+    
+    Runs as a fragment so picking a scenario for actions, or the first click of a
+    delete, only reruns this tab.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
     st.subheader("All Scenarios")
     
     if not st.session_state.lcp_data.scenarios:
@@ -96,34 +110,17 @@ def show_scenarios_overview():
         return
     
     # Create scenario summary table
-    scenario_data = []
-    for name, scenario in st.session_state.lcp_data.scenarios.items():
-        tables_count = len(scenario.tables)
-        services_count = sum(len(table.services) for table in scenario.tables.values())
-        base_year = scenario.settings.base_year if scenario.settings else "N/A"
-        discount_rate = f"{scenario.settings.discount_rate:.1%}" if scenario.settings else "N/A"
-        is_active = "✅" if name == st.session_state.lcp_data.active_scenario else ""
-        is_baseline = "🏠" if scenario.is_baseline else ""
-        
-        scenario_data.append({
-            "Scenario": name,
-            "Description": scenario.description[:50] + "..." if len(scenario.description) > 50 else scenario.description,
-            "Tables": tables_count,
-            "Services": services_count,
-            "Base Year": base_year,
-            "Discount Rate": discount_rate,
-            "Active": is_active,
-            "Baseline": is_baseline,
-            "Created": scenario.created_at.strftime("%Y-%m-%d %H:%M") if scenario.created_at else "N/A"
-        })
-    
-    df = pd.DataFrame(scenario_data)
+    signatures = tuple(
+        _scenario_signature(name, scenario)
+        for name, scenario in st.session_state.lcp_data.scenarios.items()
+    )
+    df = _build_scenarios_df(signatures, st.session_state.lcp_data.active_scenario)
     st.dataframe(df, use_container_width=True, hide_index=True)
     
     # Scenario actions
     st.subheader("Scenario Actions")
     
-    scenario_names = [name for name in st.session_state.lcp_data.scenarios.keys()]
+    scenario_names = list(st.session_state.lcp_data.scenarios)
     selected_for_action = st.selectbox("Select scenario for actions", scenario_names, key="action_scenario")
     
     if selected_for_action:
@@ -132,29 +129,29 @@ def show_scenarios_overview():
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            if st.button("📋 Copy Scenario"):
-                st.session_state.show_copy_form = selected_for_action
-                st.rerun()
+            st.button("📋 Copy Scenario", on_click=_open_scenario_form,
+                      args=("show_copy_form", selected_for_action))
         
         with col2:
-            if not scenario.is_baseline and st.button("✏️ Rename"):
-                st.session_state.show_rename_form = selected_for_action
-                st.rerun()
+            if not scenario.is_baseline:
+                st.button("✏️ Rename", on_click=_open_scenario_form,
+                          args=("show_rename_form", selected_for_action))
         
         with col3:
             if st.button("🎯 Set as Active"):
                 st.session_state.lcp_data.set_active_scenario(selected_for_action)
                 st.success(f"Set {selected_for_action} as active scenario")
-                st.rerun()
+                st.rerun(scope="app")
         
         with col4:
             if not scenario.is_baseline and st.button("🗑️ Delete", type="secondary"):
                 if st.session_state.get(f"confirm_delete_{selected_for_action}", False):
                     st.session_state.lcp_data.remove_scenario(selected_for_action)
+                    schedule_save()
                     st.success(f"Deleted scenario: {selected_for_action}")
                     if f"confirm_delete_{selected_for_action}" in st.session_state:
                         del st.session_state[f"confirm_delete_{selected_for_action}"]
-                    st.rerun()
+                    st.rerun(scope="app")
                 else:
                     st.session_state[f"confirm_delete_{selected_for_action}"] = True
                     st.warning("Click delete again to confirm")
@@ -171,16 +168,15 @@ def show_scenarios_overview():
                 with col1:
                     if st.form_submit_button("✅ Create Copy"):
                         if st.session_state.lcp_data.copy_scenario(source_name, new_name, new_description):
+                            schedule_save()
                             st.success(f"Created copy: {new_name}")
                             del st.session_state.show_copy_form
-                            st.rerun()
+                            st.rerun(scope="app")
                         else:
                             st.error("Failed to copy scenario. Name may already exist.")
                 
                 with col2:
-                    if st.form_submit_button("❌ Cancel"):
-                        del st.session_state.show_copy_form
-                        st.rerun()
+                    st.form_submit_button("❌ Cancel", on_click=_close_scenario_form, args=("show_copy_form",))
     
     # Show rename form
     if st.session_state.get("show_rename_form"):
@@ -193,19 +189,73 @@ def show_scenarios_overview():
                 with col1:
                     if st.form_submit_button("✅ Rename"):
                         if st.session_state.lcp_data.rename_scenario(old_name, new_name):
+                            schedule_save()
                             st.success(f"Renamed to: {new_name}")
                             del st.session_state.show_rename_form
-                            st.rerun()
+                            st.rerun(scope="app")
                         else:
                             st.error("Failed to rename scenario. Name may already exist.")
                 
                 with col2:
-                    if st.form_submit_button("❌ Cancel"):
-                        del st.session_state.show_rename_form
-                        st.rerun()
+                    st.form_submit_button("❌ Cancel", on_click=_close_scenario_form, args=("show_rename_form",))
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text longer than limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
 
+def _scenario_signature(name, scenario) -> tuple:
+    """Build a hashable tuple of the summary fields shown for a scenario."""
+    settings = scenario.settings
+    return (
+        name, scenario.description, scenario.is_baseline, scenario.created_at,
+        len(scenario.tables),
+        sum(len(table.services) for table in scenario.tables.values()),
+        (settings.base_year, settings.projection_years, settings.discount_rate) if settings else None,
+    )
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_scenarios_df(signatures, active_scenario) -> pd.DataFrame:
+    """Build the all-scenarios summary DataFrame from _scenario_signature tuples."""
+    scenario_data = []
+    for name, description, is_baseline, created_at, tables_count, services_count, settings in signatures:
+        scenario_data.append({
+            "Scenario": name,
+            "Description": _truncate(description, 50),
+            "Tables": tables_count,
+            "Services": services_count,
+            "Base Year": settings[0] if settings else "N/A",
+            "Discount Rate": f"{settings[2]:.1%}" if settings else "N/A",
+            "Active": "✅" if name == active_scenario else "",
+            "Baseline": "🏠" if is_baseline else "",
+            "Created": created_at.strftime("%Y-%m-%d %H:%M") if created_at else "N/A"
+        })
+    return pd.DataFrame(scenario_data)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_comparison_df(rows) -> pd.DataFrame:
+    """Build the scenario comparison DataFrame from (_scenario_signature, total cost) pairs."""
+    comparison_data = []
+    for (name, description, _, _, tables_count, services_count, settings), total_cost in rows:
+        comparison_data.append({
+            "Scenario": name,
+            "Description": _truncate(description, 30),
+            "Tables": tables_count,
+            "Services": services_count,
+            "Base Year": settings[0] if settings else "N/A",
+            "Projection Years": f"{settings[1]:.1f}" if settings else "N/A",
+            "Discount Rate": f"{settings[2]:.1%}" if settings else "N/A",
+            "Est. Total Cost": f"${total_cost:,.0f}" if total_cost > 0 else "N/A"
+        })
+    return pd.DataFrame(comparison_data)
+
+@st.fragment
 def show_create_scenario_form():
-    """Show form to create a new scenario."""
+    """Show form to create a new scenario.
+    
+    Runs as a fragment so switching the creation mode only reruns this form.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
     st.subheader("Create New Scenario")
     
     # Option to create from scratch or copy from existing
@@ -228,7 +278,7 @@ def show_create_scenario_form():
         )
         
         if creation_mode == "Copy from Another Scenario":
-            source_scenarios = list(st.session_state.lcp_data.scenarios.keys())
+            source_scenarios = list(st.session_state.lcp_data.scenarios)
             source_scenario = st.selectbox("Copy from Scenario", source_scenarios)
         else:
             source_scenario = None
@@ -301,7 +351,6 @@ def show_create_scenario_form():
                         return
                 
                 else:  # Create empty scenario
-                    from src.models import ProjectionSettings
                     new_settings = ProjectionSettings(
                         base_year=base_year,
                         projection_years=projection_years,
@@ -319,20 +368,21 @@ def show_create_scenario_form():
                     st.success(f"✅ Created empty scenario '{scenario_name}'")
                 
                 # Auto-save to database if enabled
-                if st.session_state.get('auto_save', True):
-                    try:
-                        db.save_life_care_plan(st.session_state.lcp_data)
-                        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                    except Exception as e:
-                        st.warning(f"Auto-save failed: {str(e)}")
+                schedule_save()
                 
-                st.rerun()
+                st.rerun(scope="app")
                 
             except Exception as e:
                 st.error(f"Error creating scenario: {str(e)}")
 
+@st.fragment
 def show_scenario_comparison():
-    """Show scenario comparison interface."""
+    """Show scenario comparison interface.
+    
+    Runs as a fragment so changing the selected scenarios only rebuilds this table.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
     st.subheader("📊 Scenario Comparison")
     
     if len(st.session_state.lcp_data.scenarios) < 2:
@@ -342,11 +392,11 @@ def show_scenario_comparison():
     st.write("Compare key metrics across different scenarios:")
     
     # Select scenarios to compare
-    scenario_names = list(st.session_state.lcp_data.scenarios.keys())
+    scenario_names = list(st.session_state.lcp_data.scenarios)
     selected_scenarios = st.multiselect(
         "Select scenarios to compare",
         scenario_names,
-        default=scenario_names[:3] if len(scenario_names) >= 3 else scenario_names,
+        default=scenario_names[:3],
         help="Choose 2 or more scenarios to compare"
     )
     
@@ -355,33 +405,24 @@ def show_scenario_comparison():
         return
     
     # Create comparison table
-    comparison_data = []
+    rows = []
     for scenario_name in selected_scenarios:
         scenario = st.session_state.lcp_data.scenarios[scenario_name]
-        tables_count = len(scenario.tables)
-        services_count = sum(len(table.services) for table in scenario.tables.values())
         
-        # Calculate total estimated cost (simplified)
+        # Calculate total estimated cost (simplified): the summed annual cost of all
+        # services times projection_years
         total_cost = 0
         if scenario.settings:
-            for table in scenario.tables.values():
-                for service in table.services:
-                    # Simple estimation: unit_cost * frequency * projection_years
-                    annual_cost = service.unit_cost * service.frequency_per_year
-                    total_cost += annual_cost * scenario.settings.projection_years
+            annual_cost = sum(
+                service.unit_cost * service.frequency_per_year
+                for table in scenario.tables.values()
+                for service in table.services
+            )
+            total_cost = annual_cost * scenario.settings.projection_years
         
-        comparison_data.append({
-            "Scenario": scenario_name,
-            "Description": scenario.description[:30] + "..." if len(scenario.description) > 30 else scenario.description,
-            "Tables": tables_count,
-            "Services": services_count,
-            "Base Year": scenario.settings.base_year if scenario.settings else "N/A",
-            "Projection Years": f"{scenario.settings.projection_years:.1f}" if scenario.settings else "N/A",
-            "Discount Rate": f"{scenario.settings.discount_rate:.1%}" if scenario.settings else "N/A",
-            "Est. Total Cost": f"${total_cost:,.0f}" if total_cost > 0 else "N/A"
-        })
+        rows.append((_scenario_signature(scenario_name, scenario), total_cost))
     
-    comparison_df = pd.DataFrame(comparison_data)
+    comparison_df = _build_comparison_df(tuple(rows))
     st.dataframe(comparison_df, use_container_width=True, hide_index=True)
     
     # Quick switch between scenarios
@@ -399,10 +440,16 @@ def show_scenario_comparison():
         if st.button("🎯 Switch & Go to Tables"):
             st.session_state.lcp_data.set_active_scenario(quick_switch)
             st.session_state.page = "📋 Manage Service Tables"
-            st.rerun()
+            st.rerun(scope="app")
 
+@st.fragment
 def show_scenario_settings():
-    """Show settings for the current scenario."""
+    """Show settings for the current scenario.
+    
+    Runs as a fragment; saving reruns the whole app so the header picks up the change.
+    """
+    # Fragment reruns skip the app-level flush of held-back auto-saves
+    flush_pending_saves(due_only=True)
     st.subheader("⚙️ Current Scenario Settings")
     
     current_scenario = st.session_state.lcp_data.get_current_scenario()
@@ -414,7 +461,6 @@ def show_scenario_settings():
     
     if not current_scenario.settings:
         st.warning("This scenario has no settings. Creating default settings.")
-        from src.models import ProjectionSettings
         current_scenario.settings = ProjectionSettings(
             base_year=st.session_state.lcp_data.settings.base_year,
             projection_years=st.session_state.lcp_data.settings.projection_years,
@@ -489,15 +535,10 @@ def show_scenario_settings():
                 current_scenario.settings.discount_rate = new_discount_rate / 100
                 
                 # Auto-save to database if enabled
-                if st.session_state.get('auto_save', True):
-                    try:
-                        db.save_life_care_plan(st.session_state.lcp_data)
-                        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
-                    except Exception as e:
-                        st.warning(f"Auto-save failed: {str(e)}")
+                schedule_save()
                 
                 st.success("✅ Settings updated successfully!")
-                st.rerun()
+                st.rerun(scope="app")
                 
             except Exception as e:
                 st.error(f"Error updating settings: {str(e)}")
\ No newline at end of file
@@ -5,29 +5,35 @@ Life Care Plan Streamlit Application Launcher
 This script starts the Streamlit web application for the Life Care Plan
 Table Generator. The application provides an interactive browser interface
 for creating, managing, and exporting life care plan cost projections.
+
+Pass --dev to reload the application whenever a source file is saved.
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 from pathlib import Path
 
 def check_dependencies():
-    """Check if required dependencies are installed."""
-    try:
-        import streamlit
-        import pandas
-        import plotly
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("\n📦 Please install the required dependencies:")
-        print("pip install -r streamlit_requirements.txt")
-        return False
+    """Check if required dependencies are installed.
+    
+    Only locates the packages instead of importing them; the Streamlit
+    subprocess does the real imports.
+    """
+    for name in ("streamlit", "pandas", "plotly"):
+        if importlib.util.find_spec(name) is None:
+            print(f"❌ Missing dependency: No module named '{name}'")
+            print("\n📦 Please install the required dependencies:")
+            print("pip install -r streamlit_requirements.txt")
+            return False
+    return True
 
 def main():
     """Launch the Streamlit application."""
     
+    dev_mode = "--dev" in sys.argv[1:]
+    
     print("🏥 Life Care Plan Table Generator - Streamlit Application")
     print("=" * 60)
     
@@ -50,14 +56,25 @@ def main():
     print("   • Check the terminal for any error messages")
     print("\n" + "=" * 60)
     
+    args = [
+        sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
+        "--server.headless", "false",
+        "--browser.gatherUsageStats", "false"
+    ]
+    if dev_mode:
+        # Rerun the app when a source file is saved
+        args += ["--server.runOnSave", "true"]
+    else:
+        # Without reloads there is nothing for the source file watcher to do
+        args += ["--server.fileWatcherType", "none"]
+    
     try:
-        # Start Streamlit
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
-            "--server.headless", "false",
-            "--server.runOnSave", "true",
-            "--browser.gatherUsageStats", "false"
-        ])
+        # Start Streamlit. On POSIX it replaces this process, so no launcher is left
+        # running alongside it and Ctrl+C goes straight to Streamlit.
+        if os.name == "posix":
+            sys.stdout.flush()
+            os.execv(sys.executable, args)
+        subprocess.run(args)
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down Streamlit application...")
         print("Thank you for using Life Care Plan Table Generator!")
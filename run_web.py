@@ -5,6 +5,8 @@ Life Care Plan Web Application Launcher
 This script starts the web-based GUI application for the Life Care Plan
 Table Generator. The application provides an interactive browser interface
 for creating, managing, and exporting life care plan cost projections.
+
+Pass --dev to reload the server whenever a source file is saved.
 """
 
 import uvicorn
@@ -15,6 +17,8 @@ from pathlib import Path
 def main():
     """Launch the web application."""
     
+    dev_mode = "--dev" in sys.argv[1:]
+    
     print("🏥 Life Care Plan Table Generator - Web Application")
     print("=" * 55)
     print("Starting web server...")
@@ -26,12 +30,13 @@ def main():
     os.makedirs("temp_files", exist_ok=True)
     
     try:
-        # Start the web server
+        # Start the web server. It stays a single worker: web_app keeps the
+        # plan being edited in module state, which workers would not share.
         uvicorn.run(
             "web_app:app",
             host="0.0.0.0",
             port=8000,
-            reload=True,
+            reload=dev_mode,
             log_level="info"
         )
     except KeyboardInterrupt:
@@ -0,0 +1,169 @@
+"""
+Debounced auto-save for Streamlit Life Care Plan Application
+"""
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import streamlit as st
+from .models import LifeCarePlan
+from .database import db
+from .auth import auth
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between two auto-save writes for the same session
+DEBOUNCE_SECONDS = 3.0
+
+# Savers holding changes that have not been written yet, flushed at process exit.
+# Held strongly until written, so a change outlives the session that made it.
+_pending_savers = set()
+_pending_lock = threading.Lock()
+
+@dataclass(eq=False)
+class ScheduledSaver:
+    """Coalesces the auto-saves of one session's life care plan."""
+    dirty: bool = False
+    last_write_ts: float = 0.0
+    lcp: Optional[LifeCarePlan] = None
+    user_id: Optional[int] = None
+    # (hash of the plan repr, last_saved timestamp) recorded by the last write
+    saved_signature: Optional[Tuple[int, Optional[float]]] = None
+
+    def mark_dirty(self, lcp: LifeCarePlan, user_id: Optional[int] = None):
+        """Record that the plan has changes waiting to be written."""
+        self.lcp = lcp
+        self.user_id = user_id
+        self.dirty = True
+        with _pending_lock:
+            _pending_savers.add(self)
+
+    def mark_clean(self):
+        """Drop any pending write."""
+        self.dirty = False
+        with _pending_lock:
+            _pending_savers.discard(self)
+
+    def is_due(self) -> bool:
+        """Check whether the debounce window since the last write has passed."""
+        return time.monotonic() - self.last_write_ts >= DEBOUNCE_SECONDS
+
+    def write(self):
+        """Write the pending plan to the database."""
+        db.save_life_care_plan(self.lcp, self.user_id)
+        self.last_write_ts = time.monotonic()
+        self.mark_clean()
+
+    def is_stale(self) -> bool:
+        """Check whether the evaluee was saved elsewhere since this plan was last loaded or saved."""
+        return db.get_evaluee_revision(self.lcp.evaluee.name) != self.lcp.db_revision
+
+def format_last_saved(timestamp: float) -> str:
+    """Format a last_saved timestamp for display."""
+    return time.strftime("%H:%M:%S", time.localtime(timestamp))
+
+def _get_saver() -> ScheduledSaver:
+    """Get the saver for the current session."""
+    if '_scheduled_saver' not in st.session_state:
+        st.session_state._scheduled_saver = ScheduledSaver()
+    return st.session_state._scheduled_saver
+
+def _flush(saver: ScheduledSaver):
+    """Write the saver's plan unless it is unchanged since the last auto-save.
+
+    The saved signature only counts while last_saved still holds the time the saver
+    recorded, so a save made anywhere else forces the next write through.
+    """
+    signature = hash(repr(saver.lcp))
+    if saver.saved_signature == (signature, st.session_state.get('last_saved')):
+        saver.mark_clean()
+        return
+
+    try:
+        saver.write()
+        st.session_state.last_saved = time.time()
+        saver.saved_signature = (signature, st.session_state.last_saved)
+    except Exception as e:
+        st.warning(f"Auto-save failed: {str(e)}")
+
+def schedule_save():
+    """Auto-save the current plan if enabled, at most once per DEBOUNCE_SECONDS.
+
+    Changes made inside the window stay pending until the next flush_pending_saves(),
+    which autosave_ticker() runs once the window has passed.
+    """
+    if not st.session_state.get('auto_save', True) or not st.session_state.get('lcp_data'):
+        return
+
+    # Keep the plan owned by the signed-in user, as the manual save does
+    current_user = auth.get_current_user()
+    saver = _get_saver()
+    saver.mark_dirty(st.session_state.lcp_data, current_user['id'] if current_user else None)
+    if saver.is_due():
+        _flush(saver)
+
+def flush_pending_saves(due_only: bool = False):
+    """Write the current session's pending auto-save.
+
+    With due_only, the write is held back until the debounce window has passed.
+    """
+    saver = st.session_state.get('_scheduled_saver')
+    if saver is None or not saver.dirty:
+        return
+    if due_only and not saver.is_due():
+        return
+    _flush(saver)
+
+@st.fragment(run_every=DEBOUNCE_SECONDS)
+def autosave_ticker():
+    """Write a held-back auto-save once its window has passed, even if nothing reruns.
+
+    Renders nothing; rerunning the app after a write clears the pending indicator.
+    """
+    if has_pending_save():
+        flush_pending_saves(due_only=True)
+        if not has_pending_save():
+            st.rerun(scope="app")
+
+def release_current_plan(save_pending: bool = False):
+    """Detach the session's saver from its plan before the plan is deleted or replaced.
+
+    With save_pending, a held-back auto-save of the outgoing plan is written first;
+    otherwise it is dropped so it cannot recreate a deleted evaluee.
+    """
+    saver = st.session_state.get('_scheduled_saver')
+    if saver is None:
+        return
+    if save_pending and saver.dirty:
+        _flush(saver)
+    saver.mark_clean()
+    saver.lcp = None
+
+def has_pending_save() -> bool:
+    """Check whether the current session has an auto-save still waiting to be written."""
+    saver = st.session_state.get('_scheduled_saver')
+    return saver is not None and saver.dirty
+
+@atexit.register
+def _flush_at_exit():
+    """Write every session's pending auto-save before the server shuts down.
+
+    A plan that was saved from another session in the meantime is left alone, since
+    writing it would replace the newer copy.
+    """
+    with _pending_lock:
+        savers = list(_pending_savers)
+    for saver in savers:
+        try:
+            if saver.lcp is None:
+                continue
+            if saver.is_stale():
+                logger.warning(f"Skipping auto-save at exit for {saver.lcp.evaluee.name}: saved elsewhere since")
+                continue
+            saver.write()
+        except Exception as e:
+            logger.error(f"Auto-save at exit failed: {str(e)}")
@@ -2,10 +2,13 @@ import sqlite3
 import json
 import hashlib
 import secrets
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-from .models import LifeCarePlan, Evaluee, ProjectionSettings, ServiceTable, Service
+from .models import LifeCarePlan, Evaluee, ProjectionSettings, Scenario, ServiceTable, Service
 import logging
 
 # Set up logging
@@ -17,12 +20,27 @@ class LCPDatabase:
     
     def __init__(self, db_path: str = "lcp_data.db"):
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self.init_database()
     
+    @contextmanager
+    def _connect(self):
+        """Run one transaction on the shared connection, one thread at a time.
+        
+        The connection is opened on first use and kept for the life of the process,
+        so auto-saves do not pay for a new SQLite connection each time.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            with self._conn:
+                yield self._conn
+    
     def init_database(self):
         """Initialize the database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Create users table for authentication
@@ -79,6 +97,16 @@ class LCPDatabase:
                     else:
                         raise
                 
+                # Add revision column to evaluees table if it doesn't exist (migration)
+                try:
+                    cursor.execute('ALTER TABLE evaluees ADD COLUMN revision INTEGER')
+                    logger.info("Added revision column to evaluees table")
+                except sqlite3.OperationalError as e:
+                    if "duplicate column name" in str(e).lower():
+                        pass  # Column already exists
+                    else:
+                        raise
+                
                 # Create projection_settings table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS projection_settings (
@@ -98,7 +126,7 @@ class LCPDatabase:
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         evaluee_id INTEGER NOT NULL,
                         name TEXT NOT NULL,
-                        default_inflation_rate REAL DEFAULT 3.5,
+                        default_inflation_rate REAL DEFAULT 0.035,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         FOREIGN KEY (evaluee_id) REFERENCES evaluees (id) ON DELETE CASCADE
                     )
@@ -175,7 +203,7 @@ class LCPDatabase:
     def _run_migrations(self):
         """Run database migrations to update schema."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Migration 1: Change frequency_per_year from INTEGER to REAL
@@ -249,6 +277,20 @@ class LCPDatabase:
                 except sqlite3.OperationalError as e:
                     if "duplicate column name" not in str(e).lower():
                         logger.warning(f"Migration warning: {e}")
+                
+                # Migration 3: Older versions saved some inflation rates as percentages.
+                # Convert them once and record it in user_version, so loads never guess
+                cursor.execute('PRAGMA user_version')
+                if cursor.fetchone()[0] < 1:
+                    logger.info("Converting percentage inflation rates to decimals")
+                    cursor.execute('UPDATE services SET inflation_rate = inflation_rate / 100 WHERE inflation_rate > 1.0')
+                    cursor.execute('''
+                        UPDATE service_tables SET default_inflation_rate = default_inflation_rate / 100
+                        WHERE default_inflation_rate > 1.0
+                    ''')
+                    cursor.execute('PRAGMA user_version = 1')
+                    conn.commit()
+                    logger.info("Successfully converted inflation rates to decimals")
                     
         except Exception as e:
             logger.error(f"Error running migrations: {e}")
@@ -257,7 +299,7 @@ class LCPDatabase:
     def _create_default_admin_if_needed(self):
         """Create a default admin user if no users exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Check if any users exist
@@ -287,8 +329,11 @@ class LCPDatabase:
     
     def save_life_care_plan(self, lcp: LifeCarePlan, user_id: Optional[int] = None) -> int:
         """Save a complete life care plan with scenarios to the database."""
+        # Changes on every save, so sessions can tell whether a plan was saved since
+        # they loaded it; updated_at only has one-second resolution
+        revision = time.time_ns()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Check if evaluee already exists (by name)
@@ -300,9 +345,9 @@ class LCPDatabase:
                     evaluee_id = evaluee_row[0]
                     cursor.execute('''
                         UPDATE evaluees
-                        SET current_age = ?, birth_year = ?, discount_calculations = ?, user_id = ?, updated_at = CURRENT_TIMESTAMP
+                        SET current_age = ?, birth_year = ?, discount_calculations = ?, user_id = ?, updated_at = CURRENT_TIMESTAMP, revision = ?
                         WHERE id = ?
-                    ''', (lcp.evaluee.current_age, lcp.evaluee.birth_year, lcp.evaluee.discount_calculations, user_id, evaluee_id))
+                    ''', (lcp.evaluee.current_age, lcp.evaluee.birth_year, lcp.evaluee.discount_calculations, user_id, revision, evaluee_id))
                     
                     # Delete existing data (scenarios and their tables/services will cascade)
                     cursor.execute('DELETE FROM projection_settings WHERE evaluee_id = ?', (evaluee_id,))
@@ -311,9 +356,9 @@ class LCPDatabase:
                 else:
                     # Create new evaluee
                     cursor.execute('''
-                        INSERT INTO evaluees (name, current_age, birth_year, discount_calculations, user_id)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (lcp.evaluee.name, lcp.evaluee.current_age, lcp.evaluee.birth_year, lcp.evaluee.discount_calculations, user_id))
+                        INSERT INTO evaluees (name, current_age, birth_year, discount_calculations, user_id, revision)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', (lcp.evaluee.name, lcp.evaluee.current_age, lcp.evaluee.birth_year, lcp.evaluee.discount_calculations, user_id, revision))
                     evaluee_id = cursor.lastrowid
                 
                 # Save baseline projection settings (for backward compatibility)
@@ -339,26 +384,25 @@ class LCPDatabase:
                             cursor.execute('''
                                 INSERT INTO service_tables (evaluee_id, scenario_id, name, default_inflation_rate)
                                 VALUES (?, ?, ?, ?)
-                            ''', (evaluee_id, scenario_id, table_name, getattr(table, 'default_inflation_rate', 3.5)))
+                            ''', (evaluee_id, scenario_id, table_name, table.default_inflation_rate))
                             table_id = cursor.lastrowid
                             
                             # Save services for this table
-                            for service in table.services:
-                                self._save_service(cursor, table_id, service)
+                            self._save_services(cursor, table_id, table.services)
                 else:
                     # Backward compatibility: save tables directly (no scenarios)
                     for table_name, table in lcp.tables.items():
                         cursor.execute('''
                             INSERT INTO service_tables (evaluee_id, name, default_inflation_rate)
                             VALUES (?, ?, ?)
-                        ''', (evaluee_id, table_name, getattr(table, 'default_inflation_rate', 3.5)))
+                        ''', (evaluee_id, table_name, table.default_inflation_rate))
                         table_id = cursor.lastrowid
                         
                         # Save services for this table
-                        for service in table.services:
-                            self._save_service(cursor, table_id, service)
+                        self._save_services(cursor, table_id, table.services)
                 
                 conn.commit()
+                lcp.db_revision = revision
                 logger.info(f"Successfully saved life care plan: {lcp.evaluee.name}")
                 return evaluee_id
                 
@@ -366,27 +410,37 @@ class LCPDatabase:
             logger.error(f"Error saving life care plan: {e}")
             raise
     
-    def _save_service(self, cursor, table_id: int, service):
-        """Helper method to save a service to the database."""
-        occurrence_years_json = json.dumps(service.occurrence_years) if service.occurrence_years else None
-        
-        cursor.execute('''
+    def _save_services(self, cursor, table_id: int, services):
+        """Helper method to save a table's services to the database in one batch."""
+        cursor.executemany('''
             INSERT INTO services (
                 table_id, name, inflation_rate, unit_cost, frequency_per_year,
                 start_year, end_year, occurrence_years, cost_range_low, cost_range_high,
                 use_cost_range, is_one_time_cost, one_time_cost_year
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            table_id, service.name, service.inflation_rate, service.unit_cost,
-            service.frequency_per_year, service.start_year, service.end_year,
-            occurrence_years_json, service.cost_range_low, service.cost_range_high,
-            service.use_cost_range, service.is_one_time_cost, service.one_time_cost_year
-        ))
+        ''', [
+            (
+                table_id, service.name, service.inflation_rate, service.unit_cost,
+                service.frequency_per_year, service.start_year, service.end_year,
+                json.dumps(service.occurrence_years) if service.occurrence_years else None,
+                service.cost_range_low, service.cost_range_high,
+                service.use_cost_range, service.is_one_time_cost, service.one_time_cost_year
+            )
+            for service in services
+        ])
+    
+    def get_evaluee_revision(self, evaluee_name: str) -> Optional[int]:
+        """Return the revision of an evaluee's last save, or None if it does not exist."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT revision FROM evaluees WHERE name = ?', (evaluee_name,))
+            row = cursor.fetchone()
+            return row[0] if row else None
     
     def load_life_care_plan(self, evaluee_name: str) -> Optional[LifeCarePlan]:
         """Load a life care plan with scenarios from the database by evaluee name."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get evaluee
@@ -442,7 +496,6 @@ class LCPDatabase:
                         # Load tables for this scenario
                         scenario_tables = self._load_tables_for_scenario(cursor, evaluee_id, scenario_id)
                         
-                        from src.models import Scenario
                         scenario = Scenario(
                             name=scenario_name,
                             description=scenario_description,
@@ -477,6 +530,8 @@ class LCPDatabase:
                     # Initialize baseline scenario
                     lcp.__post_init__()
                 
+                cursor.execute('SELECT revision FROM evaluees WHERE id = ?', (evaluee_id,))
+                lcp.db_revision = cursor.fetchone()[0]
                 logger.info(f"Successfully loaded life care plan: {evaluee_name}")
                 return lcp
                 
@@ -500,9 +555,9 @@ class LCPDatabase:
             table_id = table_row[0]
             table_name = table_row[2]
             
-            from src.models import ServiceTable
             table = ServiceTable(name=table_name)
-            table.default_inflation_rate = table_row[3]
+            if table_row[3] is not None:
+                table.default_inflation_rate = table_row[3]
             
             # Get services for this table
             cursor.execute('SELECT * FROM services WHERE table_id = ?', (table_id,))
@@ -517,7 +572,6 @@ class LCPDatabase:
                     except json.JSONDecodeError:
                         logger.warning(f"Invalid JSON in occurrence_years for service: {service_row[2]}")
                 
-                from src.models import Service
                 service = Service(
                     name=service_row[2],
                     inflation_rate=service_row[3],
@@ -541,7 +595,7 @@ class LCPDatabase:
     def list_evaluees(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get a list of all evaluees in the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Build query with optional user filter
@@ -608,7 +662,7 @@ class LCPDatabase:
                 return False
             
             # Check if new name already exists
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT id FROM evaluees WHERE name = ?', (new_name,))
                 if cursor.fetchone():
@@ -631,7 +685,7 @@ class LCPDatabase:
     def delete_evaluee(self, evaluee_name: str) -> bool:
         """Delete an evaluee and all associated data."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM evaluees WHERE name = ?', (evaluee_name,))
@@ -667,7 +721,7 @@ class LCPDatabase:
     def create_user(self, username: str, email: str, password: str, full_name: str = None, is_admin: bool = False) -> bool:
         """Create a new user account."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Check if username or email already exists
@@ -697,7 +751,7 @@ class LCPDatabase:
     def authenticate_user(self, username: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticate a user and return user info if successful."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Get user data
@@ -771,7 +825,7 @@ class LCPDatabase:
     def create_session(self, user_id: int, expires_hours: int = 24) -> Optional[str]:
         """Create a new session for a user."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Generate session token
@@ -795,7 +849,7 @@ class LCPDatabase:
     def validate_session(self, session_token: str) -> Optional[Dict[str, Any]]:
         """Validate a session token and return user info if valid."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Get session and user data
@@ -839,7 +893,7 @@ class LCPDatabase:
     def logout_session(self, session_token: str) -> bool:
         """Logout a session by deactivating it."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('UPDATE user_sessions SET is_active = 0 WHERE session_token = ?', (session_token,))
@@ -854,7 +908,7 @@ class LCPDatabase:
     def cleanup_expired_sessions(self):
         """Clean up expired sessions."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('UPDATE user_sessions SET is_active = 0 WHERE expires_at < ?', (datetime.now().isoformat(),))
@@ -93,6 +93,7 @@ class ServiceTable:
     """Represents a category of medical services."""
     name: str
     services: List[Service] = field(default_factory=list)
+    default_inflation_rate: float = 0.035  # Decimal, offered by the add-service form
     
     def add_service(self, service: Service) -> None:
         """Add a service to this table."""
@@ -201,6 +202,8 @@ class LifeCarePlan:
     _tables: Dict[str, ServiceTable] = field(default_factory=dict)  # Default tables (baseline scenario)
     scenarios: Dict[str, Scenario] = field(default_factory=dict)
     active_scenario: Optional[str] = None  # Name of currently active scenario
+    # evaluees.revision as of the last load or save; used to detect writes from other sessions
+    db_revision: Optional[int] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize the baseline scenario if no scenarios exist."""
@@ -7,13 +7,15 @@ It provides an interactive web interface for creating, managing, and exporting
 life care plan cost projections.
 """
 
+import logging
 import streamlit as st
-from datetime import datetime
+import time
 
 # Import core modules
 from src.models import LifeCarePlan, Evaluee, ProjectionSettings, ServiceTable, Service
 from src.database import db
 from src.auth import auth
+from src.autosave import autosave_ticker, flush_pending_saves, format_last_saved, has_pending_save, release_current_plan
 
 # Configure Streamlit page
 st.set_page_config(
@@ -39,6 +41,7 @@ def initialize_session_state():
 
 def clear_session_state():
     """Clear all session state variables safely."""
+    release_current_plan(save_pending=True)
     keys_to_clear = [
         'lcp_data', 'current_table', 'show_calculations', 'last_saved',
         'show_bulk_delete_confirm', 'navigate_to'
@@ -96,9 +99,11 @@ def create_sidebar():
         else:
             st.sidebar.info(f"📋 Tables: {len(st.session_state.lcp_data.tables)}")
 
-        # Show last saved time
-        if st.session_state.last_saved:
-            st.sidebar.caption(f"Last saved: {st.session_state.last_saved}")
+        # Show last saved time, unless an auto-save is still held back
+        if has_pending_save():
+            st.sidebar.caption("Unsaved changes pending")
+        elif st.session_state.last_saved:
+            st.sidebar.caption(f"Last saved: {format_last_saved(st.session_state.last_saved)}")
 
         # Manual save button
         col1, col2 = st.sidebar.columns(2)
@@ -220,8 +225,10 @@ def show_home_page():
             st.markdown(f"**📅 Base Year:** {st.session_state.lcp_data.settings.base_year}")
             
             # Show last saved status
-            if st.session_state.get('last_saved'):
-                st.caption(f"💾 Last saved: {st.session_state.last_saved}")
+            if has_pending_save():
+                st.caption("💾 Unsaved changes pending")
+            elif st.session_state.get('last_saved'):
+                st.caption(f"💾 Last saved: {format_last_saved(st.session_state.last_saved)}")
 
             if total_services > 0:
                 st.markdown("---")
@@ -276,7 +283,7 @@ def save_to_database():
         current_user = auth.get_current_user()
         user_id = current_user['id'] if current_user else None
         db.save_life_care_plan(st.session_state.lcp_data, user_id)
-        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
+        st.session_state.last_saved = time.time()
         st.success(f"✅ Saved {st.session_state.lcp_data.evaluee.name} to database")
     except Exception as e:
         st.error(f"Error saving to database: {str(e)}")
@@ -293,10 +300,9 @@ def auto_save_if_enabled():
         
         user_id = current_user['id']
         db.save_life_care_plan(st.session_state.lcp_data, user_id)
-        st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
+        st.session_state.last_saved = time.time()
     except Exception as e:
         # Don't show error for auto-save, just log it
-        import logging
         logging.error(f"Auto-save failed: {str(e)}")
 
 def load_from_database(evaluee_name):
@@ -304,8 +310,9 @@ def load_from_database(evaluee_name):
     try:
         lcp = db.load_life_care_plan(evaluee_name)
         if lcp:
+            release_current_plan(save_pending=True)
             st.session_state.lcp_data = lcp
-            st.session_state.last_saved = datetime.now().strftime("%H:%M:%S")
+            st.session_state.last_saved = time.time()
             st.success(f"✅ Loaded {evaluee_name} from database")
             st.rerun()
         else:
@@ -364,6 +371,7 @@ def load_sample_data():
         ))
         lcp.add_table(surgery_table)
         
+        release_current_plan(save_pending=True)
         st.session_state.lcp_data = lcp
 
         # Auto-save if enabled
@@ -387,18 +395,26 @@ def main():
 
     initialize_session_state()
 
+    # Write any auto-save that the debounce window held back on an earlier run
+    flush_pending_saves(due_only=True)
+    # Keep checking while one is still held back, in case nothing else reruns
+    if has_pending_save():
+        autosave_ticker()
+
     # Create sidebar and get selected page
     if 'page' not in st.session_state:
         st.session_state.page = "🏠 Home"
 
     # Handle programmatic navigation from other pages
     if 'navigate_to' in st.session_state:
+        flush_pending_saves()
         st.session_state.page = st.session_state.navigate_to
         del st.session_state.navigate_to
         st.rerun()
 
     selected_page = create_sidebar()
     if selected_page != st.session_state.page:
+        flush_pending_saves()
         st.session_state.page = selected_page
         st.rerun()
 
@@ -126,8 +126,8 @@ async def add_service_table(
         raise HTTPException(status_code=400, detail="Table already exists")
     
     table = ServiceTable(name=table_name)
-    # Store the default inflation rate as a table attribute
-    table.default_inflation_rate = default_inflation_rate
+    # Tables store the default inflation rate as a decimal
+    table.default_inflation_rate = default_inflation_rate / 100
     current_lcp_data.add_table(table)
     
     # Auto-save to database
@@ -470,7 +470,7 @@ async def get_table_growth_rates():
             "average_inflation_rate": round(avg_inflation, 2),
             "service_count": len(services_rates),
             "services": services_rates,
-            "table_default": getattr(table, 'default_inflation_rate', 0)
+            "table_default": table.default_inflation_rate * 100
         }
     
     return {